@@ -8,13 +8,20 @@ from __future__ import annotations
 import argparse
 import asyncio
 import contextlib
+import dataclasses
 import logging
 import signal
 import sys
+from typing import TYPE_CHECKING
 
 from . import __version__
 from .config import ConfigError, load_config
-from .logger import setup_logging
+from .logger import setup_logging, stop_logging
+
+if TYPE_CHECKING:
+    from .bedrock_proxy import BedrockProxyManager
+    from .health_server import HealthServer
+    from .webhook import WebhookNotifier
 
 log = logging.getLogger("crafty_server_watcher")
 
@@ -52,12 +59,22 @@ async def _run(config_path: str) -> None:
 
     _config_path = config_path
 
+    # Eager tasks (Python 3.12+) run synchronously until their first real
+    # suspension, skipping a loop iteration for awaits that finish at once.
+    # Every create_task() call site must therefore cope with the task's
+    # first step running inline — and possibly completing — before
+    # create_task() returns, even inside reader and protocol callbacks.
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
     # -- Load config ----------------------------------------------------------
     try:
         cfg = load_config(config_path)
     except ConfigError as exc:
         log.critical(f"Configuration error: {exc}")
         sys.exit(1)
+    applied_cfg = cfg
 
     setup_logging(cfg.logging)
     log.info(f"Crafty Server Watcher v{__version__} starting")
@@ -78,12 +95,11 @@ async def _run(config_path: str) -> None:
         pass
 
     # -- Build components (imported here to avoid circular imports) -----------
-    from .bedrock_proxy import BedrockProxyManager
+    # Optional features (webhook, Bedrock proxy, health server) are imported
+    # only when enabled, so a minimal deployment never loads them.
     from .crafty_api import CraftyApiClient
-    from .health_server import HealthServer
     from .idle_monitor import IdleMonitor
     from .proxy_listener import ProxyManager
-    from .webhook import WebhookNotifier
 
     api = CraftyApiClient(
         base_url=cfg.crafty.base_url,
@@ -91,10 +107,18 @@ async def _run(config_path: str) -> None:
         verify_tls=cfg.crafty.verify_tls,
     )
 
-    # Validate connectivity and server mappings.
-    if not await api.check_health():
+    # Validate connectivity and server mappings.  The health check and the
+    # server list are independent, so fetch both in a single round trip.
+    healthy, crafty_servers = await asyncio.gather(
+        api.check_health(),
+        api.list_servers(),
+        return_exceptions=True,
+    )
+    if healthy is not True:
         log.critical(f"Cannot reach Crafty API at {cfg.crafty.base_url} — aborting")
         sys.exit(1)
+    if isinstance(crafty_servers, BaseException):
+        raise crafty_servers
 
     log.info(f"Crafty API reachable at {cfg.crafty.base_url}")
 
@@ -106,17 +130,23 @@ async def _run(config_path: str) -> None:
         state_machines[name] = ServerStateMachine(cfg=srv_cfg, cooldowns=cfg.cooldowns)
 
     # Validate server IDs against Crafty.
-    known_servers = await api.list_servers()
-    known_ids = {s["server_id"] for s in known_servers}
-    for name, sm in state_machines.items():
-        if sm.cfg.crafty_server_id not in known_ids:
-            log.error(
-                f"Server '{name}': crafty_server_id '{sm.cfg.crafty_server_id}' not found in Crafty. Skipping.",
-            )
+    known_ids = frozenset(s["server_id"] for s in crafty_servers)
+    missing = [
+        f"'{name}' ({sm.cfg.crafty_server_id})"
+        for name, sm in state_machines.items()
+        if sm.cfg.crafty_server_id not in known_ids
+    ]
+    if missing:
+        log.error(f"crafty_server_id not found in Crafty. Skipping: {', '.join(missing)}")
+    unmanaged = known_ids.difference(sm.cfg.crafty_server_id for sm in state_machines.values())
+    if unmanaged:
+        log.debug(f"Crafty servers not managed by this watcher: {', '.join(sorted(unmanaged))}")
 
     # -- Webhook (optional) ---------------------------------------------------
     webhook: WebhookNotifier | None = None
     if cfg.webhook.enabled:
+        from .webhook import WebhookNotifier
+
         webhook = WebhookNotifier(
             webhook_url=cfg.webhook.url,
             server_name_label=cfg.webhook.label,
@@ -142,6 +172,8 @@ async def _run(config_path: str) -> None:
     # -- Bedrock proxy (optional) ---------------------------------------------
     bedrock_mgr: BedrockProxyManager | None = None
     if bedrock_sms:
+        from .bedrock_proxy import BedrockProxyManager
+
         bedrock_mgr = BedrockProxyManager(
             state_machines=bedrock_sms,
             crafty_api=api,
@@ -160,6 +192,8 @@ async def _run(config_path: str) -> None:
     # -- Health / metrics server (optional) -----------------------------------
     health_srv: HealthServer | None = None
     if cfg.health.enabled:
+        from .health_server import HealthServer
+
         health_srv = HealthServer(
             state_machines=state_machines,
             host=cfg.health.host,
@@ -170,22 +204,18 @@ async def _run(config_path: str) -> None:
     # -- Reload watcher -------------------------------------------------------
     async def _reload_watcher() -> None:
         """Watch for SIGHUP reload events and apply config changes."""
+        nonlocal applied_cfg
         while not _shutdown_event.is_set():
+            # _request_shutdown() also sets the reload event, so a single
+            # wait covers both a SIGHUP and shutdown.
+            await _reload_event.wait()
             _reload_event.clear()
-            # Wait for either a reload signal or shutdown.
-            reload_task = asyncio.create_task(_reload_event.wait())
-            shutdown_task = asyncio.create_task(_shutdown_event.wait())
-            _done, pending = await asyncio.wait(
-                {reload_task, shutdown_task},
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-            for t in pending:
-                t.cancel()
 
             if _shutdown_event.is_set():
                 break
 
-            # SIGHUP received — reload config.
+            # SIGHUP received — reload config.  load_config() is memoised on
+            # the file's contents, so an unedited file costs a read and a hash.
             log.info(f"Reloading configuration from {_config_path}")
             try:
                 new_cfg = load_config(_config_path)
@@ -193,14 +223,24 @@ async def _run(config_path: str) -> None:
                 log.error(f"Config reload failed — keeping current config: {exc}")
                 continue
 
+            # Touched but not edited (or edited and reverted): nothing to apply.
+            if new_cfg == applied_cfg:
+                log.info(f"Configuration in {_config_path} unchanged — nothing to reload.")
+                continue
+            applied_cfg = new_cfg
+
             # Apply per-server config changes (timeouts, MOTDs, kick message).
             for name, sm in state_machines.items():
                 if name in new_cfg.servers:
                     new_srv = new_cfg.servers[name]
-                    sm.cfg.idle_timeout_minutes = new_srv.idle_timeout_minutes
-                    sm.cfg.start_timeout_seconds = new_srv.start_timeout_seconds
-                    sm.cfg.motd_hibernating = new_srv.motd_hibernating
-                    sm.cfg.kick_message = new_srv.kick_message
+                    # replace() re-derives idle_timeout_seconds; ports and IDs stay as bound.
+                    sm.cfg = dataclasses.replace(
+                        sm.cfg,
+                        idle_timeout_minutes=new_srv.idle_timeout_minutes,
+                        start_timeout_seconds=new_srv.start_timeout_seconds,
+                        motd_hibernating=new_srv.motd_hibernating,
+                        kick_message=new_srv.kick_message,
+                    )
                     log.info(
                         f"Server '{name}': config updated (idle={new_srv.idle_timeout_minutes}m, motd='{new_srv.motd_hibernating}')",
                     )
@@ -215,21 +255,19 @@ async def _run(config_path: str) -> None:
             log.info("Configuration reloaded successfully.")
 
     # -- Run ------------------------------------------------------------------
-    # Collect coroutines to run.
-    tasks = [
-        idle_mon.run(_shutdown_event),
-        proxy_mgr.run(_shutdown_event),
-        _reload_watcher(),
-    ]
-    if health_srv is not None:
-        tasks.append(health_srv.run(_shutdown_event))
-    if bedrock_mgr is not None:
-        tasks.append(bedrock_mgr.run(_shutdown_event))
-
     log.info("Starting idle monitor and proxy manager…")
-    with contextlib.suppress(asyncio.CancelledError):
-        await asyncio.gather(*tasks)
-
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(idle_mon.run(_shutdown_event))
+        tg.create_task(proxy_mgr.run(_shutdown_event))
+        tg.create_task(_reload_watcher())
+        if health_srv is not None:
+            tg.create_task(health_srv.run(_shutdown_event))
+        if bedrock_mgr is not None:
+            tg.create_task(bedrock_mgr.run(_shutdown_event))
+
+    api.close()
+    if webhook is not None:
+        await webhook.close()
     log.info("Shutdown complete.")
 
 
@@ -238,6 +276,9 @@ def _request_shutdown(sig: signal.Signals) -> None:
     log.info(f"Received {sig.name}, shutting down…")
     if _shutdown_event is not None:
         _shutdown_event.set()
+    # Wake the reload watcher so it can exit.
+    if _reload_event is not None:
+        _reload_event.set()
 
 
 def _request_reload() -> None:
@@ -257,8 +298,20 @@ def main() -> None:
     )
     args = _parse_args()
 
-    with contextlib.suppress(KeyboardInterrupt):
-        asyncio.run(_run(args.config))
+    # uvloop is an optional speedup (not available on Windows); fall back to
+    # the stock asyncio loop when it isn't installed.
+    try:
+        import uvloop
+    except ImportError:
+        run = asyncio.run
+    else:
+        run = uvloop.run
+
+    try:
+        with contextlib.suppress(KeyboardInterrupt):
+            run(_run(args.config))
+    finally:
+        stop_logging()
 
 
 if __name__ == "__main__":
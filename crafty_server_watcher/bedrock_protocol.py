@@ -13,6 +13,8 @@ https://wiki.vg/Raknet_Protocol and https://bedrock.dev.
 
 from __future__ import annotations
 
+import functools
+import re
 import struct
 
 # 16-byte offline message ID (RakNet "magic")
@@ -48,6 +50,19 @@ ID_INCOMPATIBLE_PROTOCOL = 0x19
 # Current RakNet protocol version used by Bedrock
 RAKNET_PROTOCOL_VERSION = 11
 
+# Pre-compiled big-endian packers used on every packet
+_U64 = struct.Struct(">Q")
+_S64 = struct.Struct(">q")
+_U16 = struct.Struct(">H")
+
+# "§" followed by one formatting character (a dangling "§" is dropped too)
+_FORMAT_CODE_RE = re.compile("§+.?", re.DOTALL)
+
+
+def strip_formatting_codes(text: str) -> str:
+    """Remove Minecraft ``§`` color/format codes from *text*."""
+    return _FORMAT_CODE_RE.sub("", text)
+
 
 def parse_unconnected_ping(data: bytes) -> tuple[int, int] | None:
     """Parse an Unconnected Ping packet.
@@ -57,15 +72,46 @@ def parse_unconnected_ping(data: bytes) -> tuple[int, int] | None:
     if len(data) < 33 or data[0] != ID_UNCONNECTED_PING:
         return None
 
-    # Verify magic at offset 9
-    if data[9:25] != RAKNET_MAGIC:
+    # Verify magic at offset 9 (startswith avoids allocating a slice)
+    if not data.startswith(RAKNET_MAGIC, 9):
         return None
 
-    client_time = struct.unpack(">Q", data[1:9])[0]
-    client_guid = struct.unpack(">q", data[25:33])[0]
+    client_time = _U64.unpack_from(data, 1)[0]
+    client_guid = _S64.unpack_from(data, 25)[0]
     return client_time, client_guid
 
 
+@functools.lru_cache(maxsize=64)
+def _server_name_parts(
+    motd: str,
+    protocol_version: int,
+    version_name: str,
+    players_online: int,
+    max_players: int,
+    port_v4: int,
+    port_v6: int,
+) -> tuple[bytes, bytes]:
+    """Encoded server-name fields before and after the GUID.
+
+    Listeners usually share the same MOTD and ports, so the encoded pieces
+    are cached and only the per-instance GUID is spliced in.
+    """
+    prefix = ";".join(
+        [
+            "MCPE",
+            motd,
+            str(protocol_version),
+            version_name,
+            str(players_online),
+            str(max_players),
+            "",
+        ]
+    )
+    # The MOTD is repeated as MOTD line 2.
+    suffix = ";".join(["", motd, "Survival", "1", str(port_v4), str(port_v6)])
+    return prefix.encode("utf-8"), suffix.encode("utf-8")
+
+
 def build_unconnected_pong(
     client_time: int,
     server_guid: int,
@@ -82,33 +128,25 @@ def build_unconnected_pong(
     The server name string follows the Bedrock convention:
     MCPE;motd;protocol;version;online;max;guid;motd2;gamemode;gamemodenum;port4;port6
     """
-    server_name = ";".join(
-        [
-            "MCPE",
-            motd,
-            str(protocol_version),
-            version_name,
-            str(players_online),
-            str(max_players),
-            str(server_guid),
-            motd,  # MOTD line 2
-            "Survival",
-            "1",
-            str(port_v4),
-            str(port_v6),
-        ]
+    prefix, suffix = _server_name_parts(
+        motd, protocol_version, version_name, players_online, max_players, port_v4, port_v6
     )
+    name_bytes = prefix + str(server_guid).encode("ascii") + suffix
+
+    # id(1) + time(8) + guid(8) + magic(16) + name length(2) + name
+    buf = bytearray(35 + len(name_bytes))
+    buf[0] = ID_UNCONNECTED_PONG
+    _U64.pack_into(buf, 1, client_time)
+    _S64.pack_into(buf, 9, server_guid)
+    buf[17:33] = RAKNET_MAGIC
+    _U16.pack_into(buf, 33, len(name_bytes))
+    buf[35:] = name_bytes
+    return bytes(buf)
 
-    name_bytes = server_name.encode("utf-8")
 
-    buf = bytearray()
-    buf.append(ID_UNCONNECTED_PONG)
-    buf.extend(struct.pack(">Q", client_time))
-    buf.extend(struct.pack(">q", server_guid))
-    buf.extend(RAKNET_MAGIC)
-    buf.extend(struct.pack(">H", len(name_bytes)))
-    buf.extend(name_bytes)
-    return bytes(buf)
+def set_pong_client_time(pong: bytearray, client_time: int) -> None:
+    """Overwrite the client timestamp of a pre-built Unconnected Pong in place."""
+    _U64.pack_into(pong, 1, client_time)
 
 
 def build_incompatible_protocol(server_guid: int) -> bytes:
@@ -121,7 +159,7 @@ def build_incompatible_protocol(server_guid: int) -> bytes:
     buf.append(ID_INCOMPATIBLE_PROTOCOL)
     buf.append(RAKNET_PROTOCOL_VERSION)
     buf.extend(RAKNET_MAGIC)
-    buf.extend(struct.pack(">q", server_guid))
+    buf.extend(_S64.pack(server_guid))
     return bytes(buf)
 
 
@@ -129,4 +167,4 @@ def is_open_connection_request_1(data: bytes) -> bool:
     """Check if a packet is an Open Connection Request 1."""
     if len(data) < 25 or data[0] != ID_OPEN_CONNECTION_REQUEST_1:
         return False
-    return data[1:17] == RAKNET_MAGIC
+    return data.startswith(RAKNET_MAGIC, 1)
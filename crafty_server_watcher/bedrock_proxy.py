@@ -11,23 +11,50 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import hashlib
 import logging
-import random
+import socket
+import time
 
 from .bedrock_protocol import (
     build_incompatible_protocol,
     build_unconnected_pong,
     is_open_connection_request_1,
     parse_unconnected_ping,
+    set_pong_client_time,
+    strip_formatting_codes,
 )
 from .crafty_api import CraftyApiClient
-from .server_state import ServerStateMachine, State
+from .server_state import INACTIVE_STATES, ServerStateMachine, State
 
 log = logging.getLogger(__name__)
 
+# RakNet datagrams never exceed the MTU; we only inspect the first few bytes.
+_RECV_BUFSIZE = 2048
+# Upper bound on datagrams handled per readiness callback so a flood on one
+# port can't starve the rest of the event loop.
+_MAX_DATAGRAMS_PER_WAKEUP = 64
+
+# Connection-attempt log lines are emitted at most once per interval per
+# listener; a client retrying (or a flood) would otherwise spam the log.
+_ATTEMPT_LOG_INTERVAL = 1.0
+
+
+def _server_guid(name: str) -> int:
+    """Return a stable, positive 63-bit RakNet server GUID for *name*."""
+    digest = hashlib.blake2s(name.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") >> 1
+
 
 class BedrockProxyProtocol(asyncio.DatagramProtocol):
-    """UDP protocol handler for a single Bedrock server proxy."""
+    """UDP packet handler for a single Bedrock server proxy.
+
+    Reads directly from a non-blocking socket registered with
+    ``loop.add_reader`` instead of going through an asyncio
+    DatagramTransport, draining every queued datagram per wakeup.  On loops
+    without ``add_reader`` (the Windows proactor loop) it is used as a plain
+    DatagramProtocol instead.
+    """
 
     def __init__(
         self,
@@ -35,16 +62,86 @@ class BedrockProxyProtocol(asyncio.DatagramProtocol):
         sm: ServerStateMachine,
         crafty_api: CraftyApiClient,
         manager: BedrockProxyManager,
+        sock: socket.socket,
     ):
         self._name = name
         self._sm = sm
         self._api = crafty_api
         self._manager = manager
-        self._server_guid = random.getrandbits(63)
+        self._sock = sock
+        # Only set when driven through a DatagramTransport (no add_reader).
         self._transport: asyncio.DatagramTransport | None = None
+        # Derived from the server name so the GUID (and the pong built from
+        # it) stays the same across listener restarts and service restarts.
+        self._server_guid = _server_guid(name)
+
+        # The GUID is fixed per instance, so the reject packet never changes.
+        self._reject_bytes = build_incompatible_protocol(self._server_guid)
 
-    def connection_made(self, transport: asyncio.DatagramTransport) -> None:
-        self._transport = transport
+        self._last_attempt_log = 0.0
+        self._suppressed_attempts = 0
+
+        # Pre-built pong; only the client timestamp (bytes 1..9) changes per ping.
+        self._pong_template = bytearray()
+        self._pong_motd: str | None = None
+        self._pong_max: int | None = None
+        self._rebuild_pong_template()
+
+    def _rebuild_pong_template(self) -> None:
+        """(Re)build the cached Unconnected Pong from the current MOTD and max players."""
+        motd = self._sm.cfg.motd_hibernating
+        max_players = self._sm.last_known_max
+
+        # Remove § color codes (Bedrock uses § too but simpler text is safer)
+        clean_motd = strip_formatting_codes(motd)
+
+        self._pong_template = bytearray(
+            build_unconnected_pong(
+                client_time=0,
+                server_guid=self._server_guid,
+                motd=clean_motd or "Server hibernating",
+                players_online=0,
+                max_players=max_players,
+                port_v4=self._sm.cfg.listen_port,
+            )
+        )
+        self._pong_motd = motd
+        self._pong_max = max_players
+
+    def on_readable(self) -> None:
+        """Reader callback — handle every datagram queued on the socket."""
+        sock = self._sock
+        for _ in range(_MAX_DATAGRAMS_PER_WAKEUP):
+            try:
+                data, addr = sock.recvfrom(_RECV_BUFSIZE)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as exc:
+                log.warning(f"Bedrock proxy UDP error on '{self._name}': {exc}")
+                return
+            self.datagram_received(data, addr)
+            if sock.fileno() == -1:
+                # Handling it stopped this listener (a wake-up frees the port).
+                return
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport  # type: ignore[assignment]
+
+    def error_received(self, exc: Exception) -> None:
+        log.warning(f"Bedrock proxy UDP error on '{self._name}': {exc}")
+
+    def _sendto(self, data: bytes | bytearray, addr: tuple[str, int]) -> None:
+        if self._transport is not None:
+            # The transport may queue the buffer; the pong template is reused.
+            self._transport.sendto(bytes(data), addr)
+            return
+        try:
+            self._sock.sendto(data, addr)
+        except OSError as exc:
+            # Send buffer full or peer unreachable — UDP, so just drop it.
+            # Can happen for every datagram of a flood, so format only if shown.
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"Bedrock proxy send to {addr[0]} failed on '{self._name}': {exc}")
 
     def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
         """Handle incoming UDP datagrams."""
@@ -56,58 +153,49 @@ class BedrockProxyProtocol(asyncio.DatagramProtocol):
         if parsed is not None:
             client_time, _ = parsed
 
-            # Strip Minecraft formatting codes for Bedrock MOTD
-            motd = self._sm.cfg.motd_hibernating
-            # Remove § color codes (Bedrock uses § too but simpler text is safer)
-            clean_motd = ""
-            skip_next = False
-            for ch in motd:
-                if ch == "§":
-                    skip_next = True
-                    continue
-                if skip_next:
-                    skip_next = False
-                    continue
-                clean_motd += ch
+            # MOTD can change on SIGHUP and max players on every poll.
+            sm = self._sm
+            if sm.cfg.motd_hibernating != self._pong_motd or sm.last_known_max != self._pong_max:
+                self._rebuild_pong_template()
 
-            pong = build_unconnected_pong(
-                client_time=client_time,
-                server_guid=self._server_guid,
-                motd=clean_motd or "Server hibernating",
-                players_online=0,
-                max_players=self._sm.last_known_max,
-                port_v4=self._sm.cfg.listen_port,
-            )
-            self._transport.sendto(pong, addr)
+            pong = self._pong_template
+            set_pong_client_time(pong, client_time)
+            self._sendto(pong, addr)
             return
 
         # Open Connection Request 1 — someone is trying to connect
         if is_open_connection_request_1(data):
-            log.info(
-                f"Bedrock connection attempt on port {self._sm.cfg.listen_port} from {addr[0]} — triggering wake-up for '{self._name}'",
-            )
+            self._log_attempt(addr)
 
             # Reject with Incompatible Protocol (graceful rejection)
-            reject = build_incompatible_protocol(self._server_guid)
-            self._transport.sendto(reject, addr)
+            self._sendto(self._reject_bytes, addr)
 
             # Trigger server start
-            if self._sm.state in (State.STOPPED, State.CRASHED):
-                self._start_task = asyncio.ensure_future(self._manager.trigger_start(self._name))
+            if self._sm.state in INACTIVE_STATES:
+                self._manager.request_start(self._name)
             return
 
-    def error_received(self, exc: Exception) -> None:
-        log.warning(f"Bedrock proxy UDP error on '{self._name}': {exc}")
-
-    def connection_lost(self, exc: Exception | None) -> None:
-        pass
+    def _log_attempt(self, addr: tuple[str, int]) -> None:
+        """Log a connection attempt, rate-limited per listener."""
+        now = time.monotonic()
+        if now - self._last_attempt_log < _ATTEMPT_LOG_INTERVAL:
+            self._suppressed_attempts += 1
+            return
+        suppressed = self._suppressed_attempts
+        self._last_attempt_log = now
+        self._suppressed_attempts = 0
+        log.info(
+            f"Bedrock connection attempt on port {self._sm.cfg.listen_port} from {addr[0]} — triggering wake-up for '{self._name}'"
+            + (f" ({suppressed} more since last message)" if suppressed else ""),
+        )
 
 
 class BedrockProxyManager:
     """Manages UDP proxy listeners for Bedrock servers.
 
-    Mirrors the ProxyManager API but uses UDP (DatagramProtocol) instead
-    of TCP (start_server).
+    Mirrors the ProxyManager API but uses non-blocking UDP sockets driven
+    by ``loop.add_reader`` (or a DatagramTransport where the loop has no
+    ``add_reader``) instead of TCP (start_server).
     """
 
     def __init__(
@@ -117,21 +205,40 @@ class BedrockProxyManager:
     ):
         self._sms = state_machines
         self._api = crafty_api
-        self._transports: dict[str, asyncio.DatagramTransport | None] = {
-            name: None for name in state_machines
-        }
+        self._sockets: dict[str, socket.socket | None] = {name: None for name in state_machines}
+        # name → transport wrapping its socket, on loops without add_reader
+        self._transports: dict[str, asyncio.DatagramTransport] = {}
         self._start_lockout: set[str] = set()
+        # name → in-flight trigger_start task (at most one per server)
+        self._pending_start: dict[str, asyncio.Task[None]] = {}
+
+        # Set by every state machine transition (and on shutdown) so the
+        # listeners are reconciled only when something actually changed.
+        self._state_changed = asyncio.Event()
+        for sm in state_machines.values():
+            sm.state_changed = self._state_changed
 
     async def run(self, shutdown: asyncio.Event) -> None:
         """Run the Bedrock proxy manager until shutdown."""
         log.info(f"Bedrock proxy manager starting ({len(self._sms)} servers)")
+        shutdown_waiter = asyncio.create_task(shutdown.wait())
+        shutdown_waiter.add_done_callback(lambda _: self._state_changed.set())
+
         while not shutdown.is_set():
+            self._state_changed.clear()
             await self.ensure_listeners()
-            with contextlib.suppress(TimeoutError):
-                await asyncio.wait_for(shutdown.wait(), timeout=5)
+            if self._bind_pending():
+                # A bind failed (port still held) — retry shortly.
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(5):
+                        await self._state_changed.wait()
+            else:
+                await self._state_changed.wait()
+
+        shutdown_waiter.cancel()
 
         # Cleanup
-        for name in list(self._transports):
+        for name in list(self._sockets):
             await self._stop_listener(name)
         log.info("Bedrock proxy manager stopped")
 
@@ -140,45 +247,92 @@ class BedrockProxyManager:
         for name, sm in self._sms.items():
             # Respect start lockout
             if name in self._start_lockout:
-                if sm.state in (State.STOPPED, State.CRASHED):
+                if sm.state in INACTIVE_STATES and name not in self._pending_start:
                     self._start_lockout.discard(name)
                     log.info(f"Bedrock start lockout cleared for '{name}' (state={sm.state.value})")
                 else:
                     continue
 
-            if sm.is_proxy_needed and self._transports.get(name) is None:
+            if sm.is_proxy_needed and self._sockets.get(name) is None:
                 await self._start_listener(name)
-            elif not sm.is_proxy_needed and self._transports.get(name) is not None:
+            elif not sm.is_proxy_needed and self._sockets.get(name) is not None:
                 await self._stop_listener(name)
 
+    def _bind_pending(self) -> bool:
+        """True if a server needs a listener that failed to bind."""
+        return any(
+            sm.is_proxy_needed
+            and self._sockets.get(name) is None
+            and name not in self._start_lockout
+            for name, sm in self._sms.items()
+        )
+
     async def _start_listener(self, name: str) -> None:
         """Bind a UDP listener for the given server."""
         sm = self._sms[name]
+        host, port = sm.cfg.listen_host, sm.cfg.listen_port
         loop = asyncio.get_running_loop()
+        sock: socket.socket | None = None
         try:
-            transport, _ = await loop.create_datagram_endpoint(
-                lambda: BedrockProxyProtocol(name, sm, self._api, self),
-                local_addr=(sm.cfg.listen_host, sm.cfg.listen_port),
-            )
-            self._transports[name] = transport
-            log.info(
-                f"Bedrock proxy listening on {sm.cfg.listen_host}:{sm.cfg.listen_port} for '{name}'",
-            )
+            infos = await loop.getaddrinfo(host, port, type=socket.SOCK_DGRAM)
+            family, sock_type, proto, _, sockaddr = infos[0]
+            sock = socket.socket(family, sock_type, proto)
+            sock.setblocking(False)
+            sock.bind(sockaddr)
+
+            handler = BedrockProxyProtocol(name, sm, self._api, self, sock)
+            try:
+                loop.add_reader(sock.fileno(), handler.on_readable)
+            except NotImplementedError:
+                # Proactor loop (Windows default): hand the bound socket to
+                # a datagram transport instead.
+                transport, _ = await loop.create_datagram_endpoint(lambda: handler, sock=sock)
+                self._transports[name] = transport
         except OSError as exc:
-            log.error(
-                f"Cannot bind Bedrock proxy on {sm.cfg.listen_host}:{sm.cfg.listen_port} for '{name}': {exc}",
-            )
+            if sock is not None:
+                sock.close()
+            log.error(f"Cannot bind Bedrock proxy on {host}:{port} for '{name}': {exc}")
+            return
+        except BaseException:
+            if sock is not None:
+                sock.close()
+            raise
+
+        self._sockets[name] = sock
+        log.info(f"Bedrock proxy listening on {host}:{port} for '{name}'")
 
     async def _stop_listener(self, name: str) -> None:
         """Close the UDP listener for the given server."""
-        transport = self._transports.get(name)
-        if transport is not None:
-            transport.close()
-            self._transports[name] = None
+        sock = self._sockets.get(name)
+        if sock is not None:
+            transport = self._transports.pop(name, None)
+            if transport is not None:
+                transport.close()  # closes the socket too
+            else:
+                asyncio.get_running_loop().remove_reader(sock.fileno())
+                sock.close()
+            self._sockets[name] = None
             log.info(
                 f"Bedrock proxy stopped for '{name}' (port {self._sms[name].cfg.listen_port})",
             )
 
+    def request_start(self, name: str) -> None:
+        """Schedule :meth:`trigger_start` unless one is already pending for *name*.
+
+        A burst of connection attempts then costs a single task and a single
+        Crafty API call.
+        """
+        if name in self._pending_start:
+            return
+        # With eager tasks this runs trigger_start up to its first real await
+        # right here — closing this server's socket included (see
+        # on_readable) — and it may even finish before create_task returns.
+        task = asyncio.create_task(self.trigger_start(name))
+        if task.done():
+            return
+        self._pending_start[name] = task
+        task.add_done_callback(lambda _: self._pending_start.pop(name, None))
+
     async def trigger_start(self, name: str) -> None:
         """Start a Bedrock server via Crafty API."""
         sm = self._sms.get(name)
@@ -188,14 +342,12 @@ class BedrockProxyManager:
         if name in self._start_lockout:
             return
 
-        # Stop the UDP listener to free the port
-        await self._stop_listener(name)
-
         # Lock out re-binding
         self._start_lockout.add(name)
 
-        # Give OS time to release the port
-        await asyncio.sleep(5)
+        # Stop the UDP listener to free the port; closing a UDP socket
+        # releases it at once, so no settling delay is needed.
+        await self._stop_listener(name)
 
         try:
             await self._api.start_server(sm.cfg.crafty_server_id)
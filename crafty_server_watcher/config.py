@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import logging
 import os
 import sys
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 # PyYAML — the only external dependency. Justified: Python stdlib has no YAML
 # parser, and YAML was chosen as the config format.
@@ -19,13 +23,26 @@ except ImportError:
     )
     sys.exit(1)
 
+log = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# libyaml's C loader is several times faster than the pure-Python SafeLoader
+# that yaml.safe_load() always uses.  Resolved once at import.
+_Loader = getattr(yaml, "CSafeLoader", None)
+if _Loader is None:
+    log.warning(
+        "PyYAML was built without libyaml; config parsing falls back to the slower SafeLoader"
+    )
+    _Loader = yaml.SafeLoader
+
 
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class CraftyConfig:
     """Connection settings for the Crafty Controller API."""
 
@@ -47,7 +64,7 @@ class CraftyConfig:
         self.api_token = token
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfig:
     """Per-Minecraft-server settings."""
 
@@ -61,8 +78,14 @@ class ServerConfig:
     motd_hibernating: str = "§7⏳ Server is hibernating. Connect to wake it up!"
     kick_message: str = "§eServer is starting up!\n§7Please reconnect in about 60 seconds."
 
+    # Derived at construction — use dataclasses.replace() to change the minutes.
+    idle_timeout_seconds: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.idle_timeout_seconds = self.idle_timeout_minutes * 60
 
-@dataclass
+
+@dataclass(slots=True)
 class PollingConfig:
     """Polling intervals and retry behaviour."""
 
@@ -71,7 +94,7 @@ class PollingConfig:
     api_max_retries: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class CooldownConfig:
     """Anti-flap / hysteresis settings."""
 
@@ -81,8 +104,18 @@ class CooldownConfig:
     flap_max_cycles: int = 3
     flap_backoff_minutes: int = 10
 
+    # Derived at construction so the idle checks don't multiply on every poll.
+    stop_cooldown_seconds: int = field(init=False, repr=False)
+    start_grace_seconds: int = field(init=False, repr=False)
+    flap_window_seconds: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.stop_cooldown_seconds = self.stop_cooldown_minutes * 60
+        self.start_grace_seconds = self.start_grace_minutes * 60
+        self.flap_window_seconds = self.flap_window_minutes * 60
+
 
-@dataclass
+@dataclass(slots=True)
 class WebhookConfig:
     """Webhook notification settings."""
 
@@ -91,7 +124,7 @@ class WebhookConfig:
     label: str = "Crafty Server Watcher"
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging destination and rotation settings."""
 
@@ -101,7 +134,7 @@ class LoggingConfig:
     backup_count: int = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthConfig:
     """Health/status HTTP endpoint settings."""
 
@@ -110,7 +143,7 @@ class HealthConfig:
     port: int = 8095
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """Top-level application configuration."""
 
@@ -137,25 +170,101 @@ class ConfigError(Exception):
 # ---------------------------------------------------------------------------
 
 
-def _get(data: dict[str, Any], key: str, expected_type: type, default: Any = None) -> Any:
-    """Retrieve *key* from *data*, coerce to *expected_type*, fallback to *default*."""
-    value = data.get(key, default)
-    if value is None:
-        return default
+# Parsed configs keyed by a BLAKE2b digest of the file's bytes, least recent
+# first.  Keying on content rather than mtime means a touched-but-unchanged
+# file is never re-validated, and an edit that lands within the filesystem's
+# timestamp granularity is never missed.
+_CONFIG_CACHE_SIZE = 4
+_config_cache: OrderedDict[bytes, AppConfig] = OrderedDict()
+
+# Per-section schema: (key, type) pairs.  Keys missing from the YAML (or set
+# to null) are simply not passed, so the dataclass defaults apply.
+_Schema = tuple[tuple[str, type], ...]
+
+_CRAFTY_SCHEMA: _Schema = (
+    ("base_url", str),
+    ("api_token_env", str),
+    ("verify_tls", bool),
+)
+_SERVER_SCHEMA: _Schema = (
+    ("listen_host", str),
+    ("edition", str),
+    ("idle_timeout_minutes", int),
+    ("start_timeout_seconds", int),
+    ("motd_hibernating", str),
+    ("kick_message", str),
+)
+_POLLING_SCHEMA: _Schema = (
+    ("interval_seconds", int),
+    ("api_retry_delay_seconds", int),
+    ("api_max_retries", int),
+)
+_COOLDOWN_SCHEMA: _Schema = (
+    ("stop_cooldown_minutes", int),
+    ("start_grace_minutes", int),
+    ("flap_window_minutes", int),
+    ("flap_max_cycles", int),
+    ("flap_backoff_minutes", int),
+)
+_LOGGING_SCHEMA: _Schema = (
+    ("level", str),
+    ("file", str),
+    ("max_bytes", int),
+    ("backup_count", int),
+)
+_WEBHOOK_SCHEMA: _Schema = (
+    ("enabled", bool),
+    ("url", str),
+    ("label", str),
+)
+_HEALTH_SCHEMA: _Schema = (
+    ("enabled", bool),
+    ("host", str),
+    ("port", int),
+)
+
+# bool("false") is True, so quoted booleans need an explicit mapping.
+_BOOL_STRINGS = {
+    "true": True,
+    "yes": True,
+    "on": True,
+    "1": True,
+    "false": False,
+    "no": False,
+    "off": False,
+    "0": False,
+}
+
+_EDITIONS = frozenset({"java", "bedrock"})
+_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+
+def _coerce(key: str, value: Any, expected_type: type) -> Any:
+    """Coerce *value* to *expected_type*, raising ConfigError on failure."""
     try:
+        if expected_type is bool and isinstance(value, str):
+            return _BOOL_STRINGS[value.strip().lower()]
         return expected_type(value)
-    except (ValueError, TypeError) as exc:
+    except (ValueError, TypeError, KeyError) as exc:
         raise ConfigError(
             f"Config key '{key}': cannot convert {value!r} to {expected_type.__name__}"
         ) from exc
 
 
-def _load_crafty(raw: dict[str, Any]) -> CraftyConfig:
-    return CraftyConfig(
-        base_url=_get(raw, "base_url", str, CraftyConfig.base_url),
-        api_token_env=_get(raw, "api_token_env", str, CraftyConfig.api_token_env),
-        verify_tls=_get(raw, "verify_tls", bool, CraftyConfig.verify_tls),
-    )
+def _parse_fields(raw: dict[str, Any], schema: _Schema) -> dict[str, Any]:
+    """Return the coerced values of every *schema* key present in *raw*."""
+    get = raw.get
+    fields: dict[str, Any] = {}
+    for key, expected_type in schema:
+        value = get(key)
+        if value is not None:
+            fields[key] = _coerce(key, value, expected_type)
+    return fields
+
+
+def _load_section(cls: type[_T], raw: dict[str, Any] | None, schema: _Schema) -> _T:
+    """Build the dataclass *cls* from a YAML section described by *schema*."""
+    return cls(**_parse_fields(raw or {}, schema))
 
 
 def _load_server(name: str, raw: dict[str, Any]) -> ServerConfig:
@@ -165,107 +274,44 @@ def _load_server(name: str, raw: dict[str, Any]) -> ServerConfig:
     port = raw.get("listen_port")
     if port is None:
         raise ConfigError(f"Server '{name}': 'listen_port' is required.")
-    edition = _get(raw, "edition", str, ServerConfig.edition).lower()
-    if edition not in ("java", "bedrock"):
-        raise ConfigError(f"Server '{name}': edition must be 'java' or 'bedrock', got '{edition}'.")
+    fields = _parse_fields(raw, _SERVER_SCHEMA)
+    if "edition" in fields:
+        edition = fields["edition"].lower()
+        if edition not in _EDITIONS:
+            raise ConfigError(
+                f"Server '{name}': edition must be 'java' or 'bedrock', got '{edition}'."
+            )
+        fields["edition"] = edition
     return ServerConfig(
         name=name,
         crafty_server_id=str(cid),
-        listen_port=int(port),
-        listen_host=_get(raw, "listen_host", str, ServerConfig.listen_host),
-        edition=edition,
-        idle_timeout_minutes=_get(
-            raw, "idle_timeout_minutes", int, ServerConfig.idle_timeout_minutes
-        ),
-        start_timeout_seconds=_get(
-            raw, "start_timeout_seconds", int, ServerConfig.start_timeout_seconds
-        ),
-        motd_hibernating=_get(raw, "motd_hibernating", str, ServerConfig.motd_hibernating),
-        kick_message=_get(raw, "kick_message", str, ServerConfig.kick_message),
-    )
-
-
-def _load_polling(raw: dict[str, Any]) -> PollingConfig:
-    return PollingConfig(
-        interval_seconds=_get(raw, "interval_seconds", int, PollingConfig.interval_seconds),
-        api_retry_delay_seconds=_get(
-            raw, "api_retry_delay_seconds", int, PollingConfig.api_retry_delay_seconds
-        ),
-        api_max_retries=_get(raw, "api_max_retries", int, PollingConfig.api_max_retries),
-    )
-
-
-def _load_cooldowns(raw: dict[str, Any]) -> CooldownConfig:
-    return CooldownConfig(
-        stop_cooldown_minutes=_get(
-            raw, "stop_cooldown_minutes", int, CooldownConfig.stop_cooldown_minutes
-        ),
-        start_grace_minutes=_get(
-            raw, "start_grace_minutes", int, CooldownConfig.start_grace_minutes
-        ),
-        flap_window_minutes=_get(
-            raw, "flap_window_minutes", int, CooldownConfig.flap_window_minutes
-        ),
-        flap_max_cycles=_get(raw, "flap_max_cycles", int, CooldownConfig.flap_max_cycles),
-        flap_backoff_minutes=_get(
-            raw, "flap_backoff_minutes", int, CooldownConfig.flap_backoff_minutes
-        ),
+        listen_port=_coerce("listen_port", port, int),
+        **fields,
     )
 
 
-def _load_logging(raw: dict[str, Any]) -> LoggingConfig:
-    return LoggingConfig(
-        level=_get(raw, "level", str, LoggingConfig.level),
-        file=_get(raw, "file", str, LoggingConfig.file),
-        max_bytes=_get(raw, "max_bytes", int, LoggingConfig.max_bytes),
-        backup_count=_get(raw, "backup_count", int, LoggingConfig.backup_count),
-    )
+def _load_logging(raw: dict[str, Any] | None) -> LoggingConfig:
+    cfg = _load_section(LoggingConfig, raw, _LOGGING_SCHEMA)
+    cfg.level = cfg.level.upper()
+    if cfg.level not in _LOG_LEVELS:
+        raise ConfigError(
+            f"logging.level must be one of {', '.join(sorted(_LOG_LEVELS))}, got '{cfg.level}'."
+        )
+    return cfg
 
 
-def _load_webhook(raw: dict[str, Any]) -> WebhookConfig:
-    cfg = WebhookConfig(
-        enabled=_get(raw, "enabled", bool, WebhookConfig.enabled),
-        url=_get(raw, "url", str, WebhookConfig.url),
-        label=_get(raw, "label", str, WebhookConfig.label),
-    )
+def _load_webhook(raw: dict[str, Any] | None) -> WebhookConfig:
+    cfg = _load_section(WebhookConfig, raw, _WEBHOOK_SCHEMA)
     if cfg.enabled and not cfg.url:
         raise ConfigError("webhook.enabled is true but webhook.url is not set.")
     return cfg
 
 
-def _load_health(raw: dict[str, Any]) -> HealthConfig:
-    return HealthConfig(
-        enabled=_get(raw, "enabled", bool, HealthConfig.enabled),
-        host=_get(raw, "host", str, HealthConfig.host),
-        port=_get(raw, "port", int, HealthConfig.port),
-    )
-
-
-def load_config(path: str | Path) -> AppConfig:
-    """Load and validate configuration from a YAML file.
-
-    Parameters
-    ----------
-    path:
-        Filesystem path to the YAML config file.
-
-    Returns
-    -------
-    AppConfig
-        Fully-validated configuration object.
-
-    Raises
-    ------
-    ConfigError
-        If the file is missing, unparseable, or semantically invalid.
-    """
-    path = Path(path)
-    if not path.is_file():
-        raise ConfigError(f"Configuration file not found: {path}")
-
+def _parse_config(raw_bytes: bytes) -> AppConfig:
+    """Parse and validate config file contents (everything except token resolution)."""
+    # The loader decodes the UTF-8 bytes itself.
     try:
-        with path.open("r", encoding="utf-8") as fh:
-            raw: dict[str, Any] = yaml.safe_load(fh) or {}
+        raw: dict[str, Any] = yaml.load(raw_bytes, Loader=_Loader) or {}
     except yaml.YAMLError as exc:
         raise ConfigError(f"Failed to parse YAML config: {exc}") from exc
 
@@ -273,40 +319,38 @@ def load_config(path: str | Path) -> AppConfig:
         raise ConfigError("Config root must be a YAML mapping (dict).")
 
     # -- Crafty --
-    crafty = _load_crafty(raw.get("crafty", {}))
+    crafty = _load_section(CraftyConfig, raw.get("crafty"), _CRAFTY_SCHEMA)
 
     # -- Servers --
     raw_servers = raw.get("servers", {})
     if not raw_servers:
         raise ConfigError("At least one server must be defined under 'servers:'.")
     servers: dict[str, ServerConfig] = {}
-    seen_ports: dict[int, str] = {}
+    port_owner: dict[int, str] = {}
     for name, srv_raw in raw_servers.items():
         if not isinstance(srv_raw, dict):
             raise ConfigError(f"Server '{name}' must be a YAML mapping.")
         srv = _load_server(str(name), srv_raw)
-        if srv.listen_port in seen_ports:
-            raise ConfigError(
-                f"Server '{name}' and '{seen_ports[srv.listen_port]}' both use port {srv.listen_port}."
-            )
-        seen_ports[srv.listen_port] = name
+        other = port_owner.setdefault(srv.listen_port, srv.name)
+        if other != srv.name:
+            raise ConfigError(f"Server '{name}' and '{other}' both use port {srv.listen_port}.")
         servers[str(name)] = srv
 
     # -- Polling --
-    polling = _load_polling(raw.get("polling", {}))
+    polling = _load_section(PollingConfig, raw.get("polling"), _POLLING_SCHEMA)
 
     # -- Cooldowns --
-    cooldowns = _load_cooldowns(raw.get("cooldowns", {}))
+    cooldowns = _load_section(CooldownConfig, raw.get("cooldowns"), _COOLDOWN_SCHEMA)
 
     # -- Logging --
-    logging_cfg = _load_logging(raw.get("logging", {}))
+    logging_cfg = _load_logging(raw.get("logging"))
 
     # -- Webhook --
-    webhook_cfg = _load_webhook(raw.get("webhook", {}))
+    webhook_cfg = _load_webhook(raw.get("webhook"))
     # -- Health --
-    health_cfg = _load_health(raw.get("health", {}))
+    health_cfg = _load_section(HealthConfig, raw.get("health"), _HEALTH_SCHEMA)
 
-    config = AppConfig(
+    return AppConfig(
         crafty=crafty,
         servers=servers,
         polling=polling,
@@ -316,6 +360,46 @@ def load_config(path: str | Path) -> AppConfig:
         health=health_cfg,
     )
 
+
+def load_config(path: str | Path) -> AppConfig:
+    """Load and validate configuration from a YAML file.
+
+    Results are memoized on a hash of the file's contents, so reloading an
+    unchanged file skips parsing and validation.  Every call returns a fresh
+    copy, since callers mutate the config they get back.
+
+    Parameters
+    ----------
+    path:
+        Filesystem path to the YAML config file.
+
+    Returns
+    -------
+    AppConfig
+        Fully-validated configuration object.
+
+    Raises
+    ------
+    ConfigError
+        If the file is missing, unparseable, or semantically invalid.
+    """
+    path = Path(path)
+    if not path.is_file():
+        raise ConfigError(f"Configuration file not found: {path}")
+
+    raw_bytes = path.read_bytes()
+    key = hashlib.blake2b(raw_bytes, digest_size=16).digest()
+    parsed = _config_cache.get(key)
+    if parsed is None:
+        parsed = _parse_config(raw_bytes)
+        _config_cache[key] = parsed
+        if len(_config_cache) > _CONFIG_CACHE_SIZE:
+            _config_cache.popitem(last=False)
+    else:
+        _config_cache.move_to_end(key)
+
+    config = copy.deepcopy(parsed)
+
     # Resolve the API token from the environment.
     config.crafty.resolve_token()
 
@@ -1,7 +1,8 @@
 """Async client for the Crafty Controller API v2.
 
-Uses stdlib ``http.client`` wrapped in ``asyncio.to_thread()`` so we
-never block the event loop.  No external HTTP library needed.
+Uses stdlib ``http.client`` run on a dedicated thread pool so we never
+block the event loop, with keep-alive connections reused across
+requests.  No external HTTP library needed.
 """
 
 from __future__ import annotations
@@ -11,11 +12,27 @@ import http.client
 import json
 import logging
 import ssl
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from urllib.parse import urlparse
 
+# orjson is an optional speedup for parsing the stats payloads fetched on
+# every poll; fall back to the stdlib parser when it isn't installed.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 log = logging.getLogger(__name__)
 
+# Upper bound on idle keep-alive connections held between requests.  Polls
+# fetch every server's stats concurrently, so several can be in use at once.
+_MAX_IDLE_CONNECTIONS = 8
+
+# Overall deadline for one API call.  The 15s socket timeout bounds each
+# blocking operation, not a server that dribbles its response.
+_REQUEST_TIMEOUT = 20
+
 
 class CraftyApiError(Exception):
     """Raised when the Crafty API returns an unexpected response."""
@@ -57,10 +74,38 @@ class CraftyApiClient:
         else:
             self._ssl_ctx = None  # type: ignore[assignment]
 
+        # Idle keep-alive connections.  Worker threads pop and append without
+        # a lock; both are atomic list operations.
+        self._idle_conns: list[http.client.HTTPConnection] = []
+
+        # Our own workers rather than the loop's default executor, so Crafty
+        # calls neither compete with nor starve other to_thread() users.  One
+        # thread per pooled connection.
+        self._executor = ThreadPoolExecutor(
+            max_workers=_MAX_IDLE_CONNECTIONS,
+            thread_name_prefix="crafty-api",
+        )
+
+    def close(self) -> None:
+        """Stop the worker threads and close all idle keep-alive connections."""
+        self._executor.shutdown(wait=False)
+        while self._idle_conns:
+            self._idle_conns.pop().close()
+
     # ------------------------------------------------------------------
     # Low-level HTTP (runs in a thread)
     # ------------------------------------------------------------------
 
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(
+                self._host,
+                self._port,
+                context=self._ssl_ctx,
+                timeout=15,
+            )
+        return http.client.HTTPConnection(self._host, self._port, timeout=15)
+
     def _request_sync(
         self,
         method: str,
@@ -69,16 +114,6 @@ class CraftyApiClient:
         content_type: str = "application/json",
     ) -> tuple[int, dict[str, Any]]:
         """Perform a synchronous HTTP(S) request.  Returns (status, parsed_json)."""
-        if self._scheme == "https":
-            conn = http.client.HTTPSConnection(
-                self._host,
-                self._port,
-                context=self._ssl_ctx,
-                timeout=15,
-            )
-        else:
-            conn = http.client.HTTPConnection(self._host, self._port, timeout=15)
-
         headers = {
             "Authorization": f"Bearer {self._token}",
             "Accept": "application/json",
@@ -86,19 +121,48 @@ class CraftyApiClient:
         if body is not None:
             headers["Content-Type"] = content_type
 
-        try:
-            conn.request(method, path, body=body, headers=headers)
-            resp = conn.getresponse()
-            status = resp.status
-            raw = resp.read().decode("utf-8", errors="replace")
-        finally:
+        # A pooled connection may have been dropped by Crafty while it sat
+        # idle, and that only shows once a request has been sent on it.  A GET
+        # can simply be retried on the next connection; a POST (start/stop a
+        # server) might already have been acted on, so it always gets a fresh
+        # connection and is never resent.
+        idempotent = method == "GET"
+        while True:
+            reused = False
+            if idempotent and self._idle_conns:
+                try:
+                    conn = self._idle_conns.pop()
+                    reused = True
+                except IndexError:
+                    pass  # raced with another worker thread
+            if not reused:
+                conn = self._new_connection()
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                resp = conn.getresponse()
+                status = resp.status
+                raw = resp.read()
+            except (http.client.BadStatusLine, ConnectionError):
+                conn.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            break
+
+        if resp.will_close or len(self._idle_conns) >= _MAX_IDLE_CONNECTIONS:
             conn.close()
+        else:
+            self._idle_conns.append(conn)
 
-        # The Crafty API always returns JSON for /api/ endpoints.
+        # The Crafty API always returns JSON for /api/ endpoints.  Both parsers
+        # take the bytes directly; invalid UTF-8 surfaces as a ValueError too.
         try:
-            data = json.loads(raw) if raw else {}
-        except json.JSONDecodeError:
-            data = {"raw": raw}
+            data = _json_loads(raw) if raw else {}
+        except ValueError:
+            data = {"raw": raw.decode("utf-8", errors="replace")}
 
         return status, data
 
@@ -108,7 +172,7 @@ class CraftyApiClient:
         path: str,
         body: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Async wrapper — offloads the sync HTTP call to a thread.
+        """Async wrapper — offloads the sync HTTP call to a worker thread.
 
         Raises
         ------
@@ -118,24 +182,32 @@ class CraftyApiClient:
             If the connection fails entirely.
         """
         body_str = json.dumps(body) if body else None
-        log.debug(f"{method} {path}")
+        # Runs for every server on every poll: only build the messages if
+        # DEBUG is actually on.
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug(f"{method} {path}")
 
         try:
-            status, data = await asyncio.to_thread(
-                self._request_sync,
-                method,
-                path,
-                body_str,
-            )
+            async with asyncio.timeout(_REQUEST_TIMEOUT):
+                status, data = await asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    self._request_sync,
+                    method,
+                    path,
+                    body_str,
+                )
         except (OSError, http.client.HTTPException) as exc:
+            # TimeoutError (an OSError) has no message of its own.
             raise ConnectionError(
-                f"Crafty API connection failed for {method} {path}: {exc}"
+                f"Crafty API connection failed for {method} {path}: {str(exc) or 'timed out'}"
             ) from exc
 
         if status >= 400:
             raise CraftyApiError(status, json.dumps(data), path)
 
-        log.debug(f"{method} {path} → {status}")
+        if debug:
+            log.debug(f"{method} {path} → {status}")
         return data
 
     # ------------------------------------------------------------------
@@ -193,15 +265,17 @@ class CraftyApiClient:
         body_str = command
         log.debug(f"POST /api/v2/servers/{server_id}/stdin")
         try:
-            status, data = await asyncio.to_thread(
-                self._request_sync,
-                "POST",
-                f"/api/v2/servers/{server_id}/stdin",
-                body_str,
-                "text/plain",
-            )
+            async with asyncio.timeout(_REQUEST_TIMEOUT):
+                status, data = await asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    self._request_sync,
+                    "POST",
+                    f"/api/v2/servers/{server_id}/stdin",
+                    body_str,
+                    "text/plain",
+                )
         except (OSError, http.client.HTTPException) as exc:
-            raise ConnectionError(f"stdin command failed: {exc}") from exc
+            raise ConnectionError(f"stdin command failed: {str(exc) or 'timed out'}") from exc
         if status >= 400:
             raise CraftyApiError(status, json.dumps(data), f"/api/v2/servers/{server_id}/stdin")
         return data.get("status") == "ok"
@@ -2,13 +2,14 @@
 
 Exposes three endpoints:
 - GET /health   → 200 OK (for Docker HEALTHCHECK / Uptime Kuma)
-- GET /status   → 200 JSON with per-server state details
+- GET /status   → 200 JSON with per-server state details (``?pretty=1`` to indent)
 - GET /metrics  → 200 Prometheus text exposition format
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
 import time
@@ -21,6 +22,43 @@ from .server_state import ServerStateMachine
 log = logging.getLogger(__name__)
 
 
+def _head(status: HTTPStatus, content_type: str) -> bytes:
+    """Encode a response head, leaving ``%d`` for the Content-Length."""
+    return (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        "Content-Length: %d\r\n"
+        "Connection: close\r\n"
+        "\r\n"
+    ).encode("ascii")
+
+
+def _canned(status: HTTPStatus, body: str) -> bytes:
+    """Encode a complete plain-text response with a fixed body."""
+    encoded = body.encode("utf-8")
+    return _head(status, "text/plain") % len(encoded) + encoded
+
+
+# Response heads and fixed responses, encoded once at import.
+_JSON_HEAD = _head(HTTPStatus.OK, "application/json")
+_METRICS_HEAD = _head(HTTPStatus.OK, "text/plain; version=0.0.4; charset=utf-8")
+_HEALTH_OK = _canned(HTTPStatus.OK, "OK")
+_BAD_REQUEST = _canned(HTTPStatus.BAD_REQUEST, "Bad Request")
+_NOT_FOUND = _canned(HTTPStatus.NOT_FOUND, "Not Found")
+_METHOD_NOT_ALLOWED = _canned(HTTPStatus.METHOD_NOT_ALLOWED, "Method Not Allowed")
+
+# Deadline for a client to send its complete request line and headers.
+_REQUEST_TIMEOUT = 5
+
+# Serialised /status and /metrics bodies are reused for this many seconds,
+# so bursts of scrapes don't rebuild them every time.
+_BODY_TTL = 0.5
+
+# Pending-connection queue for the listener; room for a burst of scrapes
+# arriving while the event loop is busy elsewhere.
+_LISTEN_BACKLOG = 128
+
+
 class HealthServer:
     """Minimal async HTTP server using stdlib asyncio streams.
 
@@ -45,6 +83,9 @@ class HealthServer:
         self._port = port
         self._server: asyncio.Server | None = None
         self._start_time = time.monotonic()
+        # (built-at monotonic time, encoded body)
+        self._status_cache: tuple[float, bytes] | None = None
+        self._metrics_cache: tuple[float, bytes] | None = None
 
     async def run(self, shutdown: asyncio.Event) -> None:
         """Start the server, wait for shutdown, then close."""
@@ -53,6 +94,8 @@ class HealthServer:
             self._handle_request,
             self._host,
             self._port,
+            reuse_address=True,
+            backlog=_LISTEN_BACKLOG,
         )
         log.info(f"Health server listening on {self._host}:{self._port}")
 
@@ -69,35 +112,53 @@ class HealthServer:
     ) -> None:
         """Parse a minimal HTTP request and route to /health or /status."""
         try:
-            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
-            if not request_line:
-                return
+            # One deadline for the whole request: cheaper than a wait_for()
+            # per line, and a client can't stretch it by dribbling headers.
+            async with asyncio.timeout(_REQUEST_TIMEOUT):
+                try:
+                    request_line = await reader.readline()
+                    if not request_line:
+                        return
+
+                    # Health probes are by far the most frequent request and
+                    # don't care about headers; answer on the request line
+                    # alone.  Closing without reading the headers is safe:
+                    # the transport has already pulled the rest of such a
+                    # small request off the socket.
+                    if request_line.startswith(b"GET /health "):
+                        writer.write(_HEALTH_OK)
+                        return
+
+                    # Anything else: consume the headers (not needed) up to
+                    # the blank line.  Line by line, because simple clients
+                    # end lines with a bare LF rather than CRLF.
+                    while await reader.readline() not in (b"\r\n", b"\n", b""):
+                        pass
+                except ValueError:
+                    # Line longer than the stream limit.
+                    writer.write(_BAD_REQUEST)
+                    return
 
             parts = request_line.decode("utf-8", errors="replace").strip().split()
             if len(parts) < 2:
-                self._send_response(writer, HTTPStatus.BAD_REQUEST, "Bad Request")
+                writer.write(_BAD_REQUEST)
                 return
 
-            method, path = parts[0], parts[1]
-
-            # Drain remaining headers (we don't need them).
-            while True:
-                line = await asyncio.wait_for(reader.readline(), timeout=5)
-                if line in (b"\r\n", b"\n", b""):
-                    break
+            method = parts[0]
+            path, _, query = parts[1].partition("?")
 
             if method != "GET":
-                self._send_response(writer, HTTPStatus.METHOD_NOT_ALLOWED, "Method Not Allowed")
+                writer.write(_METHOD_NOT_ALLOWED)
             elif path == "/health":
-                self._send_response(writer, HTTPStatus.OK, "OK")
+                writer.write(_HEALTH_OK)
             elif path == "/status":
-                body = self._build_status_json()
-                self._send_json(writer, HTTPStatus.OK, body)
+                body = self._status_body(pretty="pretty=1" in query.split("&"))
+                writer.write(_JSON_HEAD % len(body) + body)
             elif path == "/metrics":
-                body = self._build_metrics()
-                self._send_plain(writer, HTTPStatus.OK, body)
+                body = self._metrics_body()
+                writer.write(_METRICS_HEAD % len(body) + body)
             else:
-                self._send_response(writer, HTTPStatus.NOT_FOUND, "Not Found")
+                writer.write(_NOT_FOUND)
 
         except (TimeoutError, ConnectionResetError, EOFError):
             pass
@@ -105,10 +166,50 @@ class HealthServer:
             log.exception("Health server request error")
         finally:
             try:
-                writer.close()
-                await writer.wait_closed()
+                # The response is always a single write; half-close right
+                # behind it so the FIN rides on its last segment, and flush
+                # before tearing the connection down — but not for longer
+                # than a request may take, or a client that never reads
+                # would hold the connection open indefinitely.
+                if writer.can_write_eof():
+                    writer.write_eof()
+                async with asyncio.timeout(_REQUEST_TIMEOUT):
+                    await writer.drain()
+            except TimeoutError:
+                # close() would wait for the unsent data; drop it instead.
+                writer.transport.abort()
             except Exception:
                 pass
+            finally:
+                writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
+
+    def _status_body(self, pretty: bool = False) -> bytes:
+        """Encoded /status payload, rebuilt at most every ``_BODY_TTL`` seconds.
+
+        The cached body is compact JSON for machine consumers; *pretty*
+        builds an indented copy for humans and bypasses the cache.
+        """
+        if pretty:
+            return json.dumps(self._build_status_json(), indent=2).encode("utf-8")
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached is not None and now - cached[0] < _BODY_TTL:
+            return cached[1]
+        body = json.dumps(self._build_status_json(), separators=(",", ":")).encode("utf-8")
+        self._status_cache = (now, body)
+        return body
+
+    def _metrics_body(self) -> bytes:
+        """Encoded /metrics payload, rebuilt at most every ``_BODY_TTL`` seconds."""
+        now = time.monotonic()
+        cached = self._metrics_cache
+        if cached is not None and now - cached[0] < _BODY_TTL:
+            return cached[1]
+        body = self._build_metrics().encode("utf-8")
+        self._metrics_cache = (now, body)
+        return body
 
     def _build_status_json(self) -> dict[str, Any]:
         uptime = time.monotonic() - self._start_time
@@ -139,40 +240,3 @@ class HealthServer:
             start_count=start_counts,
             stop_count=stop_counts,
         )
-
-    @staticmethod
-    def _send_response(writer: asyncio.StreamWriter, status: HTTPStatus, body: str) -> None:
-        response = (
-            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
-            f"Content-Type: text/plain\r\n"
-            f"Content-Length: {len(body)}\r\n"
-            f"Connection: close\r\n"
-            f"\r\n"
-            f"{body}"
-        )
-        writer.write(response.encode("utf-8"))
-
-    @staticmethod
-    def _send_json(writer: asyncio.StreamWriter, status: HTTPStatus, data: dict) -> None:
-        body = json.dumps(data, indent=2)
-        response = (
-            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
-            f"Content-Type: application/json\r\n"
-            f"Content-Length: {len(body)}\r\n"
-            f"Connection: close\r\n"
-            f"\r\n"
-            f"{body}"
-        )
-        writer.write(response.encode("utf-8"))
-
-    @staticmethod
-    def _send_plain(writer: asyncio.StreamWriter, status: HTTPStatus, body: str) -> None:
-        encoded = body.encode("utf-8")
-        header = (
-            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
-            f"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
-            f"Content-Length: {len(encoded)}\r\n"
-            f"Connection: close\r\n"
-            f"\r\n"
-        )
-        writer.write(header.encode("utf-8") + encoded)
@@ -7,17 +7,49 @@ state machine, and orchestrates stop/start actions and proxy lifecycle.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import time
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from .config import CooldownConfig, PollingConfig
 from .crafty_api import CraftyApiClient, CraftyApiError
 from .proxy_listener import ProxyManager
-from .server_state import ServerStateMachine, State
-from .webhook import WebhookNotifier
+from .server_state import INACTIVE_STATES, ServerStateMachine, State
+
+if TYPE_CHECKING:
+    from .webhook import WebhookNotifier
 
 log = logging.getLogger(__name__)
 
+# Ceiling for the retry delay while the Crafty API keeps failing.
+_MAX_BACKOFF_SECONDS = 60
+
+# States whose poll outcome depends on elapsed time (idle and start
+# timeouts), not just on the stats.
+_TIMED_STATES = frozenset({State.IDLE, State.STARTING})
+
+
+class _PolledStats(NamedTuple):
+    """The fields of a Crafty stats response that drive state transitions."""
+
+    running: bool
+    crashed: bool
+    online: int
+    int_ping: str
+
+
+def _extract_stats(stats: dict[str, Any]) -> _PolledStats:
+    """Pull the transition-relevant fields out of a raw stats dict in one go."""
+    get = stats.get
+    return _PolledStats(
+        bool(get("running", False)),
+        bool(get("crashed", False)),
+        int(get("online", 0)),
+        str(get("int_ping_results", "")),
+    )
+
 
 class IdleMonitor:
     """Async polling loop that checks Crafty server stats and enforces
@@ -53,6 +85,17 @@ class IdleMonitor:
         self._cd_cfg = cooldown_cfg
         self._webhook = webhook
         self._consecutive_failures = 0
+        # Per server: the stats and resulting state from the previous poll.
+        self._last_polled: dict[str, tuple[_PolledStats, State]] = {}
+        # In-flight webhook sends by (server name, notification), holding strong
+        # refs so they aren't GC'd mid-flight.
+        self._notify_tasks: dict[tuple[str, str], asyncio.Task[None]] = {}
+        # Set to poll ahead of schedule: when a server's idle timeout expires
+        # (so it's stopped on time, not up to a poll interval late) and on
+        # shutdown.
+        self._wake = asyncio.Event()
+        for sm in state_machines.values():
+            sm.on_idle_timeout = self._wake.set
 
     # ------------------------------------------------------------------
     # Main loop
@@ -66,19 +109,25 @@ class IdleMonitor:
         await self._poll_all()
         await self._proxy.ensure_listeners()
 
+        shutdown_waiter = asyncio.create_task(shutdown.wait())
+        shutdown_waiter.add_done_callback(lambda _: self._wake.set())
+
         while not shutdown.is_set():
-            try:
-                await asyncio.wait_for(
-                    shutdown.wait(),
-                    timeout=self._poll_cfg.interval_seconds,
-                )
-                break  # shutdown requested
-            except TimeoutError:
-                pass  # normal: timeout = time to poll
+            # Timing out is the normal case: time for the next poll.
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(self._next_poll_delay()):
+                    await self._wake.wait()
+            if shutdown.is_set():
+                break
+            self._wake.clear()
 
             await self._poll_all()
             await self._proxy.ensure_listeners()
 
+        shutdown_waiter.cancel()
+        if self._notify_tasks:
+            # Give pending notifications a chance to go out before exit.
+            await asyncio.wait(self._notify_tasks.values(), timeout=10)
         log.info("Idle monitor stopped")
 
     # ------------------------------------------------------------------
@@ -87,21 +136,30 @@ class IdleMonitor:
 
     async def _poll_all(self) -> None:
         """Poll stats for every managed server and process transitions."""
-        for name, sm in self._sms.items():
+        items = list(self._sms.items())
+        # Crafty has no bulk stats endpoint, so fetch each distinct server
+        # once (a Geyser server may be listed for both editions) and all of
+        # them concurrently: a poll costs one round trip of wall time.
+        # Transitions are still processed one server at a time below.
+        server_ids = list(dict.fromkeys(sm.cfg.crafty_server_id for _, sm in items))
+        results = await asyncio.gather(
+            *(self._api.get_server_stats(server_id) for server_id in server_ids),
+            return_exceptions=True,
+        )
+        stats_by_id = dict(zip(server_ids, results, strict=True))
+        # The poll as a whole fails only if nothing came back and at least one
+        # request failed in a way that points at Crafty itself.
+        reached = False
+        failure: Exception | None = None
+        for name, sm in items:
+            result = stats_by_id[sm.cfg.crafty_server_id]
             try:
-                await self._poll_one(name, sm)
-                self._consecutive_failures = 0
+                if isinstance(result, BaseException):
+                    raise result
+                reached = True
+                await self._poll_one(name, sm, result)
             except ConnectionError as exc:
-                self._consecutive_failures += 1
-                log.warning(
-                    f"Crafty API unreachable (attempt {self._consecutive_failures}/{self._poll_cfg.api_max_retries}): {exc}",
-                )
-                if self._consecutive_failures >= self._poll_cfg.api_max_retries:
-                    log.error(
-                        f"Crafty API unreachable after {self._consecutive_failures} attempts — "
-                        "holding current state, will keep retrying.",
-                    )
-                await asyncio.sleep(self._poll_cfg.api_retry_delay_seconds)
+                failure = exc
             except CraftyApiError as exc:
                 if exc.status == 403:
                     log.critical(
@@ -111,138 +169,202 @@ class IdleMonitor:
                     # Stop polling — manual intervention needed.
                     return
                 log.error(f"Crafty API error for server '{name}': {exc}")
+                if exc.status >= 500:
+                    failure = exc
             except Exception:
                 log.exception(f"Unexpected error polling server '{name}'")
 
-    async def _poll_one(self, name: str, sm: ServerStateMachine) -> None:
-        """Fetch stats for a single server and drive its state machine."""
-        stats = await self._api.get_server_stats(sm.cfg.crafty_server_id)
+        if reached or failure is None:
+            if self._consecutive_failures:
+                log.info("Crafty API reachable again — resuming normal polling.")
+            self._consecutive_failures = 0
+            return
+
+        self._consecutive_failures += 1
+        attempts = self._consecutive_failures
+        max_retries = self._poll_cfg.api_max_retries
+        if attempts < max_retries:
+            log.warning(
+                f"Crafty API unreachable (attempt {attempts}/{max_retries}): {failure} — "
+                f"retrying in {self._next_poll_delay()}s",
+            )
+        elif attempts == max_retries:
+            log.error(
+                f"Crafty API unreachable after {attempts} attempts — "
+                "holding current state, will keep retrying with backoff.",
+            )
+        else:
+            log.debug(f"Crafty API still unreachable (attempt {attempts}): {failure}")
+
+    def _next_poll_delay(self) -> int:
+        """Seconds until the next poll.
+
+        The normal interval, or while the Crafty API keeps failing, the retry
+        delay doubled per consecutive failure (capped) if that is longer.
+        """
+        interval = self._poll_cfg.interval_seconds
+        if not self._consecutive_failures:
+            return interval
+        backoff = self._poll_cfg.api_retry_delay_seconds * 2 ** (self._consecutive_failures - 1)
+        return max(interval, min(backoff, _MAX_BACKOFF_SECONDS))
+
+    async def _poll_one(self, name: str, sm: ServerStateMachine, stats: dict[str, Any]) -> None:
+        """Drive a single server's state machine from its freshly fetched *stats*."""
+        now = time.monotonic()
         sm.update_from_stats(stats)
 
-        running: bool = bool(stats.get("running", False))
-        crashed: bool = bool(stats.get("crashed", False))
-        online: int = int(stats.get("online", 0))
-        int_ping: str = str(stats.get("int_ping_results", ""))
+        polled = _extract_stats(stats)
+        running, crashed, online, int_ping = polled
 
-        log.debug(
-            f"Poll '{name}': state={sm.state.value} running={running} online={online} crashed={crashed} int_ping={int_ping}",
-        )
+        # Every server, every poll: skip building the f-string unless it'll be emitted.
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"Poll '{name}': state={sm.state.value} running={running} online={online} crashed={crashed} int_ping={int_ping}",
+            )
+
+        state = sm.state
+        # Nothing changed since the last poll: the transitions below would
+        # all be no-ops, unless the outcome also depends on the clock.
+        if state not in _TIMED_STATES and self._last_polled.get(name) == (polled, state):
+            return
 
         # ── Determine desired state ─────────────────────────────────
-        if crashed:
-            if sm.state != State.CRASHED:
-                sm.transition(State.CRASHED)
+        match (crashed, running, state):
+            case (True, _, State.CRASHED):
+                pass  # already known to be crashed
+
+            case (True, _, _):
+                sm.transition(State.CRASHED, now)
                 if self._webhook:
-                    self._crash_notify_task = asyncio.ensure_future(
-                        self._webhook.notify_crashed(name)
-                    )
-            return
+                    self._notify(name, self._webhook.notify_crashed(name))
 
-        if not running:
-            if sm.state == State.STARTING:
+            case (_, False, State.STARTING):
                 # Still waiting — check if we've exceeded the timeout.
-                if sm.last_start_time and (
-                    time.monotonic() - sm.last_start_time > sm.cfg.start_timeout_seconds
-                ):
+                if sm.last_start_time and (now - sm.last_start_time > sm.cfg.start_timeout_seconds):
                     log.error(
                         f"Server '{name}': start timed out after {sm.cfg.start_timeout_seconds}s — giving up.",
                     )
-                    sm.transition(State.STOPPED)
+                    sm.transition(State.STOPPED, now)
                 # else: still starting, keep waiting.
-                return
 
-            if sm.state not in (State.STOPPED, State.CRASHED):
-                sm.transition(State.STOPPED)
-            return
+            case (_, False, _):
+                if state not in INACTIVE_STATES:
+                    sm.transition(State.STOPPED, now)
 
-        # Server is running.
-        if sm.state == State.STARTING:
-            # Check if the server is truly ready (internal ping succeeds).
-            if int_ping == "True":
-                sm.transition(State.ONLINE)
-            # else: running but not yet accepting connections — stay STARTING.
-            return
+            # ── Server is running ───────────────────────────────────
+            case (_, _, State.STARTING):
+                # Check if the server is truly ready (internal ping succeeds).
+                if int_ping == "True":
+                    sm.transition(State.ONLINE, now)
+                # else: running but not yet accepting connections — stay STARTING.
 
-        if sm.state in (State.STOPPED, State.STARTING, State.CRASHED, State.UNKNOWN):
-            # Server came online (possibly started externally).
-            if online > 0:
-                sm.transition(State.ONLINE)
-            else:
-                sm.transition(State.IDLE)
-            return
+            case (_, _, State.STOPPED | State.CRASHED | State.UNKNOWN):
+                # Server came online (possibly started externally).
+                sm.transition(State.ONLINE if online > 0 else State.IDLE, now)
 
-        if sm.state == State.STOPPING:
-            # We asked it to stop, but it's still running — keep waiting.
-            return
+            case (_, _, State.STOPPING):
+                pass  # we asked it to stop, but it's still running — keep waiting
 
-        # ── Handle ONLINE / IDLE ────────────────────────────────────
-        if online > 0:
-            if sm.state != State.ONLINE:
-                sm.transition(State.ONLINE)
-            return
+            # ── Handle ONLINE / IDLE ────────────────────────────────
+            case (_, _, State.IDLE) if online > 0:
+                sm.transition(State.ONLINE, now)
 
-        # online == 0
-        if sm.state == State.ONLINE:
-            sm.transition(State.IDLE)
-            return
+            case (_, _, State.ONLINE) if online == 0:
+                sm.transition(State.IDLE, now)
 
-        if sm.state == State.IDLE:
-            await self._check_idle_shutdown(name, sm)
-            return
+            case (_, _, State.IDLE):
+                await self._check_idle_shutdown(name, sm, now)
+
+        # Only a poll that changed nothing is a fixed point; after a
+        # transition the same stats may still drive a further step (e.g.
+        # STARTING → ONLINE, then ONLINE → IDLE with nobody on).
+        if sm.state is state:
+            self._last_polled[name] = (polled, state)
+        else:
+            self._last_polled.pop(name, None)
 
     # ------------------------------------------------------------------
     # Idle shutdown logic
     # ------------------------------------------------------------------
 
-    async def _check_idle_shutdown(self, name: str, sm: ServerStateMachine) -> None:
-        """Evaluate whether an idle server should be shut down."""
+    async def _check_idle_shutdown(self, name: str, sm: ServerStateMachine, now: float) -> None:
+        """Evaluate whether an idle server should be shut down.
+
+        *now* is the ``time.monotonic()`` value sampled for this poll.
+        """
+        cooldowns = sm.cooldowns
         # Don't start counting idle time during the start-grace period.
-        if sm.in_start_grace():
-            remaining = sm.cooldowns.start_grace_minutes * 60 - (
-                time.monotonic() - (sm.last_start_time or 0)
-            )
-            log.info(
-                f"Server '{name}': in start-grace period ({remaining:.0f}s remaining), idle check paused.",
-            )
+        if sm.in_start_grace(now):
+            if log.isEnabledFor(logging.INFO):
+                remaining = cooldowns.start_grace_seconds - (now - (sm.last_start_time or 0))
+                log.info(
+                    f"Server '{name}': in start-grace period ({remaining:.0f}s remaining), idle check paused.",
+                )
             return
 
         # Don't stop again during the stop-cooldown period.
-        if sm.in_stop_cooldown():
-            remaining = sm.cooldowns.stop_cooldown_minutes * 60 - (
-                time.monotonic() - (sm.last_stop_time or 0)
-            )
-            log.info(
-                f"Server '{name}': in stop-cooldown ({remaining:.0f}s remaining), idle check paused.",
-            )
+        if sm.in_stop_cooldown(now):
+            if log.isEnabledFor(logging.INFO):
+                remaining = cooldowns.stop_cooldown_seconds - (now - (sm.last_stop_time or 0))
+                log.info(
+                    f"Server '{name}': in stop-cooldown ({remaining:.0f}s remaining), idle check paused.",
+                )
             return
 
         # Flap guard.
-        if sm.is_flapping():
+        if sm.is_flapping(now):
             log.warning(
                 f"Server '{name}': flap guard active — too many start/stop cycles "
                 f"in the last {self._cd_cfg.flap_window_minutes} minutes. Waiting {self._cd_cfg.flap_backoff_minutes} minutes before next stop.",
             )
             return
 
-        if not sm.idle_timeout_reached():
-            elapsed = sm.idle_elapsed()
-            remaining = sm.cfg.idle_timeout_minutes * 60 - elapsed
-            log.info(
-                f"Server '{name}': idle for {elapsed:.0f}s / {sm.cfg.idle_timeout_minutes * 60}s, shutdown in {remaining:.0f}s.",
-            )
+        if not sm.idle_timeout_reached(now):
+            if log.isEnabledFor(logging.INFO):
+                elapsed = sm.idle_elapsed(now)
+                timeout = sm.cfg.idle_timeout_seconds
+                log.info(
+                    f"Server '{name}': idle for {elapsed:.0f}s / {timeout}s, shutdown in {timeout - elapsed:.0f}s.",
+                )
             return
 
         # ── Trigger shutdown ────────────────────────────────────────
+        # Capture before the transition — entering STOPPING clears idle_since.
+        idle_seconds = sm.idle_elapsed(now)
         log.info(
-            f"Server '{name}' (port {sm.cfg.listen_port}): idle for {sm.idle_elapsed():.0f}s — triggering shutdown.",
+            f"Server '{name}' (port {sm.cfg.listen_port}): idle for {idle_seconds:.0f}s — triggering shutdown.",
         )
-        sm.transition(State.STOPPING)
+        sm.transition(State.STOPPING, now)
         try:
             await self._api.stop_server(sm.cfg.crafty_server_id)
             if self._webhook:
-                await self._webhook.notify_stopped(name, idle_seconds=sm.idle_elapsed())
+                self._notify(
+                    name,
+                    self._webhook.notify_stopped(name, idle_seconds=idle_seconds),
+                )
         except Exception:
             log.exception(f"Failed to stop server '{name}' via Crafty API")
             # Revert to IDLE so we retry on the next poll.
             sm.transition(State.ONLINE)  # STOPPING → … can't revert cleanly
             # The next poll will detect running=true and re-evaluate.
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _notify(self, name: str, coro: Coroutine[Any, Any, None]) -> None:
+        """Send a webhook notification about server *name* in the background.
+
+        The poll loop never waits on the webhook's HTTP round trip.  If the
+        same notification for *name* is still in flight (a slow or dead
+        webhook during a crash loop), this one is dropped.
+        """
+        key = (name, coro.__name__)
+        if key in self._notify_tasks:
+            coro.close()
+            return
+        task = asyncio.create_task(coro)
+        if task.done():
+            return  # an eager task can finish before create_task returns
+        self._notify_tasks[key] = task
+        task.add_done_callback(lambda _: self._notify_tasks.pop(key, None))
@@ -3,13 +3,18 @@
 Configures:
 - A RotatingFileHandler for the dedicated log file.
 - A StreamHandler on stderr (captured by journald when running under systemd).
+
+Both are driven by a QueueListener on a background thread; the root logger
+only has a QueueHandler, so logging never blocks the event loop on disk
+writes or log rotation.
 """
 
 from __future__ import annotations
 
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 from .config import LoggingConfig
@@ -17,6 +22,9 @@ from .config import LoggingConfig
 LOG_FORMAT = "%(asctime)s %(levelname)-5s [%(name)s] %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Background thread writing records to the real handlers; see stop_logging().
+_listener: QueueListener | None = None
+
 
 def setup_logging(cfg: LoggingConfig) -> None:
     """Configure the root logger based on the application config.
@@ -26,6 +34,8 @@ def setup_logging(cfg: LoggingConfig) -> None:
     cfg:
         Logging configuration (level, file path, rotation settings).
     """
+    global _listener
+
     level = getattr(logging, cfg.level.upper(), logging.INFO)
     root = logging.getLogger()
     root.setLevel(level)
@@ -44,10 +54,29 @@ def setup_logging(cfg: LoggingConfig) -> None:
     )
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
-    root.addHandler(file_handler)
 
     # -- stderr handler (journald) --------------------------------------------
     stderr_handler = logging.StreamHandler(sys.stderr)
     stderr_handler.setLevel(level)
     stderr_handler.setFormatter(formatter)
-    root.addHandler(stderr_handler)
+
+    # -- Hand both off to the listener thread ---------------------------------
+    stop_logging()
+    # Replaces the bootstrap handler from main()'s basicConfig().
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, file_handler, stderr_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the background logging thread."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
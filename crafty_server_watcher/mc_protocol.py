@@ -10,9 +10,8 @@ Reference: https://minecraft.wiki/w/Protocol
 
 from __future__ import annotations
 
-import io
+import functools
 import json
-import struct
 from dataclasses import dataclass
 from typing import Any
 
@@ -21,14 +20,22 @@ from typing import Any
 # =====================================================================
 
 
-def read_varint(stream: io.BytesIO) -> int:
-    """Read a Minecraft VarInt from a byte stream."""
+# Encoded VarInts for 0-127: one byte each, and what nearly every packet ID,
+# length and enum value in the handshake/status/login exchange fits in.
+_SMALL_VARINTS = tuple(bytes((i,)) for i in range(0x80))
+
+
+def _read_varint_at(buf: memoryview, pos: int) -> tuple[int, int]:
+    """Read a VarInt from *buf* at offset *pos*.  Returns (value, next_pos)."""
+    end = len(buf)
+    if pos < end and buf[pos] < 0x80:
+        # Single-byte fast path.
+        return buf[pos], pos + 1
     result = 0
     for i in range(5):  # VarInt is at most 5 bytes
-        byte = stream.read(1)
-        if not byte:
-            raise EOFError("Unexpected end of stream while reading VarInt")
-        b = byte[0]
+        if pos + i >= end:
+            raise EOFError("Unexpected end of buffer while reading VarInt")
+        b = buf[pos + i]
         result |= (b & 0x7F) << (7 * i)
         if not (b & 0x80):
             break
@@ -37,11 +44,24 @@ def read_varint(stream: io.BytesIO) -> int:
     # Sign-extend for 32-bit
     if result & (1 << 31):
         result -= 1 << 32
-    return result
+    return result, pos + i + 1
+
+
+def _read_utf_at(buf: memoryview, pos: int) -> tuple[str, int]:
+    """Read a VarInt-prefixed UTF-8 string at *pos*.  Returns (value, next_pos)."""
+    length, pos = _read_varint_at(buf, pos)
+    if length < 0:
+        raise ValueError("Negative string length")
+    end = pos + length
+    if end > len(buf):
+        raise EOFError("Unexpected end of buffer while reading string")
+    return str(buf[pos:end], "utf-8"), end
 
 
 def write_varint(value: int) -> bytes:
     """Encode an integer as a Minecraft VarInt."""
+    if 0 <= value < 0x80:
+        return _SMALL_VARINTS[value]
     # Treat as unsigned 32-bit for encoding.
     if value < 0:
         value += 1 << 32
@@ -57,39 +77,22 @@ def write_varint(value: int) -> bytes:
     return bytes(out)
 
 
-def read_utf(stream: io.BytesIO) -> str:
-    """Read a Minecraft-style UTF-8 string (VarInt length-prefixed)."""
-    length = read_varint(stream)
-    data = stream.read(length)
-    if len(data) < length:
-        raise EOFError("Unexpected end of stream while reading string")
-    return data.decode("utf-8")
-
-
 def write_utf(value: str) -> bytes:
     """Encode a string as a Minecraft-style VarInt-prefixed UTF-8 string."""
     encoded = value.encode("utf-8")
     return write_varint(len(encoded)) + encoded
 
 
-def read_unsigned_short(stream: io.BytesIO) -> int:
-    """Read a big-endian unsigned short."""
-    data = stream.read(2)
-    if len(data) < 2:
-        raise EOFError("Unexpected end of stream while reading unsigned short")
-    return struct.unpack(">H", data)[0]
-
-
 # =====================================================================
 # Packet framing
 # =====================================================================
 
 
-async def read_packet(reader: Any) -> tuple[int, io.BytesIO]:
+async def read_packet_payload(reader: Any) -> tuple[int, memoryview]:
     """Read a single MC packet from an asyncio StreamReader.
 
-    Returns (packet_id, payload_stream).  The payload stream's position
-    is right after the packet ID.
+    Returns (packet_id, payload): a zero-copy view of the bytes after the
+    packet ID, for the ``from_payload()`` parsers below.
     """
     # Read the length VarInt byte-by-byte from the async reader.
     length = await _read_varint_async(reader)
@@ -97,10 +100,9 @@ async def read_packet(reader: Any) -> tuple[int, io.BytesIO]:
         raise EOFError("Invalid packet length")
     if length > 2 * 1024 * 1024:  # 2 MB sanity cap
         raise ValueError(f"Packet too large: {length} bytes")
-    data = await reader.readexactly(length)
-    stream = io.BytesIO(data)
-    packet_id = read_varint(stream)
-    return packet_id, stream
+    data = memoryview(await reader.readexactly(length))
+    packet_id, pos = _read_varint_at(data, 0)
+    return packet_id, data[pos:]
 
 
 async def _read_varint_async(reader: Any) -> int:
@@ -121,8 +123,10 @@ async def _read_varint_async(reader: Any) -> int:
 
 def build_packet(packet_id: int, payload: bytes) -> bytes:
     """Frame a packet: length-prefix(packet_id + payload)."""
-    inner = write_varint(packet_id) + payload
-    return write_varint(len(inner)) + inner
+    # Size the length prefix up front so the payload (up to a whole favicon
+    # for status responses) is copied once, into the final packet.
+    id_bytes = write_varint(packet_id)
+    return b"".join((write_varint(len(id_bytes) + len(payload)), id_bytes, payload))
 
 
 # =====================================================================
@@ -140,11 +144,13 @@ class Handshake:
     next_state: int  # 1 = Status, 2 = Login
 
     @classmethod
-    def parse(cls, stream: io.BytesIO) -> Handshake:
-        protocol_version = read_varint(stream)
-        server_address = read_utf(stream)
-        server_port = read_unsigned_short(stream)
-        next_state = read_varint(stream)
+    def from_payload(cls, payload: memoryview) -> Handshake:
+        protocol_version, pos = _read_varint_at(payload, 0)
+        server_address, pos = _read_utf_at(payload, pos)
+        if pos + 2 > len(payload):
+            raise EOFError("Unexpected end of buffer while reading unsigned short")
+        server_port = (payload[pos] << 8) | payload[pos + 1]
+        next_state, _ = _read_varint_at(payload, pos + 2)
         return cls(protocol_version, server_address, server_port, next_state)
 
 
@@ -155,8 +161,8 @@ class LoginStart:
     player_name: str
 
     @classmethod
-    def parse(cls, stream: io.BytesIO) -> LoginStart:
-        name = read_utf(stream)
+    def from_payload(cls, payload: memoryview) -> LoginStart:
+        name, _ = _read_utf_at(payload, 0)
         # Modern protocol also has a UUID, but we only need the name.
         return cls(name)
 
@@ -166,6 +172,7 @@ class LoginStart:
 # =====================================================================
 
 
+@functools.lru_cache(maxsize=64)
 def build_status_response(
     motd: str,
     version_name: str = "Hibernating",
@@ -178,6 +185,9 @@ def build_status_response(
 
     Using ``protocol: -1`` makes the entry show as "incompatible" in the
     server list, but the MOTD and player counts still display.
+
+    Memoised: the inputs only change on reload or when Crafty reports new
+    player slots/icon, so repeated pings reuse the encoded packet.
     """
     payload: dict[str, Any] = {
         "version": {"name": version_name, "protocol": protocol},
@@ -191,18 +201,27 @@ def build_status_response(
     return build_packet(0x00, write_utf(json_str))
 
 
+# Length prefix and packet ID of a Pong carrying the usual 8-byte payload.
+_PONG_HEADER = build_packet(0x01, bytes(8))[:-8]
+
+
 def build_pong(payload_long: bytes) -> bytes:
     """Build a Pong packet (0x01 in the status state).
 
     *payload_long* is the raw 8-byte long from the Ping packet.
     """
+    if len(payload_long) == 8:
+        # The usual case: the framing is fixed, so just prepend it.
+        return _PONG_HEADER + payload_long
     return build_packet(0x01, payload_long)
 
 
+@functools.lru_cache(maxsize=32)
 def build_disconnect(reason: str) -> bytes:
     """Build a Disconnect packet (0x00 in the login state).
 
-    The reason is a JSON Chat component.
+    The reason is a JSON Chat component.  Memoised like
+    :func:`build_status_response`.
     """
     chat = json.dumps({"text": reason}, ensure_ascii=False)
     return build_packet(0x00, write_utf(chat))
@@ -9,18 +9,58 @@ Designed to be served by the HealthServer on ``GET /metrics``.
 
 from __future__ import annotations
 
+import functools
+
 from .server_state import ServerStateMachine
 
 # Prefix for all metrics
 _NS = "crafty_watcher"
 
+# Per-server metrics whose sample value varies: (name, help, type).
+_PER_SERVER_METRICS = (
+    ("players_online", "Current online player count", "gauge"),
+    ("players_max", "Max player slots", "gauge"),
+    ("idle_seconds", "Seconds the server has been idle (0 if not idle)", "gauge"),
+    ("starts_total", "Total times this server was started", "counter"),
+    ("stops_total", "Total times this server was stopped", "counter"),
+)
+
 
-def _gauge(name: str, help_text: str, labels: dict[str, str], value: float | int) -> str:
+def _gauge(name: str, help_text: str, labels: dict[str, str], value: float | int | str) -> str:
     """Format a single Prometheus gauge sample."""
     label_str = ",".join(f'{k}="{v}"' for k, v in labels.items())
     return f"{name}{{{label_str}}} {value}"
 
 
+@functools.lru_cache(maxsize=8)
+def _template(names: tuple[str, ...]) -> str:
+    """Build the payload for *names* with a ``%`` slot in place of every value.
+
+    The set of servers is fixed for the life of the process, so this is
+    built once and each scrape only has to interpolate the current values.
+    """
+    # Server names are literal text in the template.
+    escaped = [name.replace("%", "%%") for name in names]
+    lines = [
+        f"# HELP {_NS}_uptime_seconds Time since the service started",
+        f"# TYPE {_NS}_uptime_seconds gauge",
+        f"{_NS}_uptime_seconds %.1f",
+        "",
+        f"# HELP {_NS}_server_state Current server state (1=active)",
+        f"# TYPE {_NS}_server_state gauge",
+    ]
+    lines += [
+        _gauge(f"{_NS}_server_state", "", {"server": name, "state": "%s"}, 1) for name in escaped
+    ]
+    lines.append("")
+    for metric, help_text, kind in _PER_SERVER_METRICS:
+        lines.append(f"# HELP {_NS}_{metric} {help_text}")
+        lines.append(f"# TYPE {_NS}_{metric} {kind}")
+        lines += [_gauge(f"{_NS}_{metric}", "", {"server": name}, "%s") for name in escaped]
+        lines.append("")
+    return "\n".join(lines) + "\n"
+
+
 def generate_metrics(
     state_machines: dict[str, ServerStateMachine],
     uptime_seconds: float,
@@ -28,51 +68,27 @@ def generate_metrics(
     stop_count: dict[str, int],
 ) -> str:
     """Return a complete Prometheus text exposition payload."""
-    lines: list[str] = []
-
-    # ── Uptime ──────────────────────────────────────────────────
-    lines.append(f"# HELP {_NS}_uptime_seconds Time since the service started")
-    lines.append(f"# TYPE {_NS}_uptime_seconds gauge")
-    lines.append(f"{_NS}_uptime_seconds {uptime_seconds:.1f}")
-    lines.append("")
-
-    # ── Per-server metrics ──────────────────────────────────────
-    lines.append(f"# HELP {_NS}_server_state Current server state (1=active)")
-    lines.append(f"# TYPE {_NS}_server_state gauge")
-    for name, sm in state_machines.items():
-        labels = {"server": name, "state": sm.state.value}
-        lines.append(_gauge(f"{_NS}_server_state", "", labels, 1))
-    lines.append("")
-
-    lines.append(f"# HELP {_NS}_players_online Current online player count")
-    lines.append(f"# TYPE {_NS}_players_online gauge")
+    # One pass over the servers, gathering each metric's values in the
+    # same order as the slots in _template().
+    states: list[str] = []
+    online: list[int] = []
+    max_players: list[int] = []
+    idle: list[float] = []
+    starts: list[int] = []
+    stops: list[int] = []
     for name, sm in state_machines.items():
-        lines.append(_gauge(f"{_NS}_players_online", "", {"server": name}, sm.last_known_online))
-    lines.append("")
-
-    lines.append(f"# HELP {_NS}_players_max Max player slots")
-    lines.append(f"# TYPE {_NS}_players_max gauge")
-    for name, sm in state_machines.items():
-        lines.append(_gauge(f"{_NS}_players_max", "", {"server": name}, sm.last_known_max))
-    lines.append("")
-
-    lines.append(f"# HELP {_NS}_idle_seconds Seconds the server has been idle (0 if not idle)")
-    lines.append(f"# TYPE {_NS}_idle_seconds gauge")
-    for name, sm in state_machines.items():
-        idle = round(sm.idle_elapsed(), 1) if sm.idle_since else 0
-        lines.append(_gauge(f"{_NS}_idle_seconds", "", {"server": name}, idle))
-    lines.append("")
-
-    lines.append(f"# HELP {_NS}_starts_total Total times this server was started")
-    lines.append(f"# TYPE {_NS}_starts_total counter")
-    for name in state_machines:
-        lines.append(_gauge(f"{_NS}_starts_total", "", {"server": name}, start_count.get(name, 0)))
-    lines.append("")
-
-    lines.append(f"# HELP {_NS}_stops_total Total times this server was stopped")
-    lines.append(f"# TYPE {_NS}_stops_total counter")
-    for name in state_machines:
-        lines.append(_gauge(f"{_NS}_stops_total", "", {"server": name}, stop_count.get(name, 0)))
-    lines.append("")
-
-    return "\n".join(lines) + "\n"
+        states.append(sm.state.value)
+        online.append(sm.last_known_online)
+        max_players.append(sm.last_known_max)
+        idle.append(round(sm.idle_elapsed(), 1) if sm.idle_since else 0)
+        starts.append(start_count.get(name, 0))
+        stops.append(stop_count.get(name, 0))
+    return _template(tuple(state_machines)) % (
+        uptime_seconds,
+        *states,
+        *online,
+        *max_players,
+        *idle,
+        *starts,
+        *stops,
+    )
@@ -10,8 +10,10 @@ the Minecraft protocol just enough to:
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 from .crafty_api import CraftyApiClient
 from .mc_protocol import (
@@ -20,13 +22,33 @@ from .mc_protocol import (
     build_disconnect,
     build_pong,
     build_status_response,
-    read_packet,
+    read_packet_payload,
 )
-from .server_state import ServerStateMachine, State
-from .webhook import WebhookNotifier
+from .server_state import INACTIVE_STATES, ServerStateMachine, State
+
+if TYPE_CHECKING:
+    from .webhook import WebhookNotifier
 
 log = logging.getLogger(__name__)
 
+# Retrying a bind while the port is still held: the delay starts short and
+# doubles up to a ceiling, for at most this long overall.
+_BIND_RETRY_SECONDS = 30
+_BIND_RETRY_MIN_DELAY = 0.1
+_BIND_RETRY_MAX_DELAY = 2.0
+
+# Flood protection for scanners hammering a hibernating port: at most this
+# many client connections are handled at once across all listeners, and each
+# source IP has a leaky bucket holding this many connections that drains
+# completely over the window; anything over is closed before a byte is read.
+_MAX_CONCURRENT_CLIENTS = 256
+_PER_IP_WINDOW_SECONDS = 10.0
+_PER_IP_MAX_CONNECTIONS = 20
+_PER_IP_LEAK_RATE = _PER_IP_MAX_CONNECTIONS / _PER_IP_WINDOW_SECONDS
+# Size cap for the per-IP table.  Drained buckets are swept at most once per
+# window when it is full; new IPs that still don't fit are refused.
+_MAX_TRACKED_IPS = 4096
+
 
 class ProxyManager:
     """Manages per-port asyncio TCP servers for hibernating MC servers.
@@ -49,6 +71,22 @@ class ProxyManager:
         # Servers where we triggered a start — NEVER re-bind proxy for these
         # until they go back to STOPPED or CRASHED.
         self._start_lockout: set[str] = set()
+        # Servers whose start_server call is still in flight; their lockout
+        # must survive the not-yet-STARTING state until the call returns.
+        self._pending_start: set[str] = set()
+        # name → background task binding its listener (at most one per server)
+        self._pending_binds: dict[str, asyncio.Task[None]] = {}
+        # name → whether the last ensure_listeners() wanted a listener; lets
+        # unchanged servers be skipped.  Dropped wherever the listener is
+        # changed behind ensure_listeners' back so the next call re-applies it.
+        self._last_desired: dict[str, bool] = {}
+        self._conn_sem = asyncio.Semaphore(_MAX_CONCURRENT_CLIENTS)
+        # source IP → (window start, connections in window)
+        self._ip_buckets: dict[str, tuple[float, float]] = {}  # ip -> (level, at)
+        self._next_sweep = 0.0
+        # In-flight webhook sends, holding strong refs so they aren't GC'd
+        # mid-flight.
+        self._webhook_tasks: set[asyncio.Task[None]] = set()
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -58,14 +96,18 @@ class ProxyManager:
         """Block until the shutdown event is set, then close all listeners."""
         await shutdown.wait()
         await self.stop_all()
+        if self._webhook_tasks:
+            # Give pending notifications a chance to go out before exit.
+            await asyncio.wait(self._webhook_tasks, timeout=10)
 
     async def ensure_listeners(self) -> None:
         """Start or stop listeners to match the current server states."""
+        to_stop: list[str] = []
         for name, sm in self._sms.items():
             # If we triggered a start, NEVER re-bind until server is back to
             # STOPPED or CRASHED.
             if name in self._start_lockout:
-                if sm.state in (State.STOPPED, State.CRASHED):
+                if sm.state in INACTIVE_STATES and name not in self._pending_start:
                     # Server went back to stopped — clear lockout, allow proxy.
                     self._start_lockout.discard(name)
                     log.info(f"Start lockout cleared for '{name}' (state={sm.state.value})")
@@ -73,13 +115,27 @@ class ProxyManager:
                     # Still starting/online — keep port free.
                     continue
 
-            if sm.is_proxy_needed:
-                await self._start_listener(name)
+            desired = sm.is_proxy_needed
+            if self._last_desired.get(name) is desired:
+                continue
+            self._last_desired[name] = desired
+            if desired:
+                self._request_listener(name)  # binds in the background
             else:
-                await self._stop_listener(name)
+                to_stop.append(name)
+
+        # Close the listeners that are no longer needed concurrently.
+        results = await asyncio.gather(
+            *(self._stop_listener(name) for name in to_stop),
+            return_exceptions=True,
+        )
+        for name, result in zip(to_stop, results, strict=True):
+            if isinstance(result, Exception):
+                log.error(f"Failed to stop proxy listener for '{name}': {result!r}")
 
     async def stop_all(self) -> None:
         """Shut down every active listener."""
+        self._last_desired.clear()
         for name in list(self._listeners):
             await self._stop_listener(name)
 
@@ -87,6 +143,26 @@ class ProxyManager:
     # Internal
     # ------------------------------------------------------------------
 
+    def _request_listener(self, name: str) -> None:
+        """Bind the listener for *name* in the background.
+
+        A port that is still held can take a while to come free; retrying in
+        a task keeps that from holding up the other servers (and the caller).
+        No-op if the listener is already running or being bound.
+        """
+        if self._listeners[name] is not None or name in self._pending_binds:
+            return
+        task = asyncio.create_task(self._start_listener(name))
+        if task.done():
+            return  # an eager task can bind (or give up) before returning
+        self._pending_binds[name] = task
+
+        def _done(_: asyncio.Task[None]) -> None:
+            if self._pending_binds.get(name) is task:
+                del self._pending_binds[name]
+
+        task.add_done_callback(_done)
+
     async def _start_listener(self, name: str) -> None:
         """Bind the proxy listener for *name* if it isn't already running."""
         if self._listeners[name] is not None:
@@ -94,13 +170,16 @@ class ProxyManager:
 
         sm = self._sms[name]
 
-        async def _client_cb(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
-            await self._handle_client(name, reader, writer)
-
-        for attempt in range(15):  # retry binding for up to 30s
+        client_cb = functools.partial(self._handle_client, name)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _BIND_RETRY_SECONDS
+        delay = _BIND_RETRY_MIN_DELAY
+        attempt = 0
+        while True:
+            attempt += 1
             try:
                 server = await asyncio.start_server(
-                    _client_cb,
+                    client_cb,
                     host=sm.cfg.listen_host,
                     port=sm.cfg.listen_port,
                 )
@@ -110,18 +189,24 @@ class ProxyManager:
                 )
                 return
             except OSError as exc:
-                if attempt < 14:
-                    log.debug(
-                        f"Port {sm.cfg.listen_port} not free yet (attempt {attempt + 1}): {exc}",
-                    )
-                    await asyncio.sleep(2)
-                else:
+                if loop.time() + delay > deadline:
                     log.error(
-                        f"Cannot bind to port {sm.cfg.listen_port} for server '{name}' after 30s: {exc}",
+                        f"Cannot bind to port {sm.cfg.listen_port} for server '{name}' after {_BIND_RETRY_SECONDS}s: {exc}",
+                    )
+                    self._last_desired.pop(name, None)  # try again next time round
+                    return
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(
+                        f"Port {sm.cfg.listen_port} not free yet (attempt {attempt}): {exc}",
                     )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _BIND_RETRY_MAX_DELAY)
 
     async def _stop_listener(self, name: str) -> None:
-        """Close the proxy listener for *name* if it is running."""
+        """Close the proxy listener for *name*, or abandon binding it."""
+        bind = self._pending_binds.pop(name, None)
+        if bind is not None:
+            bind.cancel()
         server = self._listeners.get(name)
         if server is None:
             return
@@ -133,6 +218,32 @@ class ProxyManager:
             f"Proxy listener stopped on port {sm.cfg.listen_port} for server '{name}'",
         )
 
+    def _allow_client(self, ip: str) -> bool:
+        """Count a connection from *ip*; False if it is over its per-IP budget."""
+        now = time.monotonic()
+        buckets = self._ip_buckets
+        bucket = buckets.get(ip)
+        if bucket is None:
+            if len(buckets) >= _MAX_TRACKED_IPS:
+                if now < self._next_sweep:
+                    return False
+                self._next_sweep = now + _PER_IP_WINDOW_SECONDS
+                cutoff = now - _PER_IP_WINDOW_SECONDS
+                for stale in [k for k, (_, t) in buckets.items() if t <= cutoff]:
+                    del buckets[stale]
+                # Still full: a flood from this many sources is refused
+                # outright rather than growing the table without bound.
+                if len(buckets) >= _MAX_TRACKED_IPS:
+                    return False
+            level = 0.0
+        else:
+            level, at = bucket
+            level = max(0.0, level - (now - at) * _PER_IP_LEAK_RATE)
+            if level + 1 > _PER_IP_MAX_CONNECTIONS:
+                return False
+        buckets[ip] = (level + 1, now)
+        return True
+
     async def _handle_client(
         self,
         name: str,
@@ -142,20 +253,28 @@ class ProxyManager:
         """Handle a single incoming MC client connection."""
         sm = self._sms[name]
         peer = writer.get_extra_info("peername", ("?", 0))
+        if self._conn_sem.locked() or not self._allow_client(peer[0]):
+            # Flooded: drop it without reading or parsing anything.
+            writer.close()
+            return
         try:
-            # 1) Read Handshake (packet id 0x00 in handshake state)
-            pkt_id, stream = await asyncio.wait_for(read_packet(reader), timeout=10)
-            if pkt_id != 0x00:
-                return
-            handshake = Handshake.parse(stream)
-
-            if handshake.next_state == 1:
-                # ── Status (Server List Ping) ────────────────────────
-                await self._handle_status(sm, reader, writer)
-
-            elif handshake.next_state == 2:
-                # ── Login ────────────────────────────────────────────
-                await self._handle_login(name, sm, reader, writer, peer)
+            # Not locked (checked above), so this never waits.
+            async with self._conn_sem:
+                # 1) Read Handshake (packet id 0x00 in handshake state)
+                # asyncio.timeout() rather than wait_for(): no extra Task per read.
+                async with asyncio.timeout(10):
+                    pkt_id, payload = await read_packet_payload(reader)
+                if pkt_id != 0x00:
+                    return
+                handshake = Handshake.from_payload(payload)
+
+                if handshake.next_state == 1:
+                    # ── Status (Server List Ping) ────────────────────────
+                    await self._handle_status(sm, reader, writer)
+
+                elif handshake.next_state == 2:
+                    # ── Login ────────────────────────────────────────────
+                    await self._handle_login(name, sm, reader, writer, peer)
 
         except (EOFError, TimeoutError, asyncio.IncompleteReadError):
             # Client disconnected or timed out — ignore silently.
@@ -177,25 +296,28 @@ class ProxyManager:
     ) -> None:
         """Handle Server List Ping: send fake MOTD, answer Ping with Pong."""
         # Read Status Request (packet 0x00, empty payload)
-        await asyncio.wait_for(read_packet(reader), timeout=5)
+        async with asyncio.timeout(5):
+            await read_packet_payload(reader)
 
+        icon = sm.last_known_icon
         resp = build_status_response(
             motd=sm.cfg.motd_hibernating,
             version_name="Hibernating",
             protocol=-1,
             max_players=sm.last_known_max,
             online_players=0,
-            favicon=sm.last_known_icon if sm.last_known_icon else "",
+            favicon=icon or "",
         )
+        # No drain here: the transport sends immediately when the socket is
+        # writable, and the pong (or close) below flushes whatever is left.
         writer.write(resp)
-        await writer.drain()
 
         # Read Ping → send Pong
         try:
-            pkt_id, stream = await asyncio.wait_for(read_packet(reader), timeout=5)
+            async with asyncio.timeout(5):
+                pkt_id, payload = await read_packet_payload(reader)
             if pkt_id == 0x01:
-                payload_long = stream.read(8)
-                writer.write(build_pong(payload_long))
+                writer.write(build_pong(bytes(payload[:8])))
                 await writer.drain()
         except (EOFError, TimeoutError, asyncio.IncompleteReadError):
             pass
@@ -210,50 +332,59 @@ class ProxyManager:
     ) -> None:
         """Handle Login Start: kick the player, release the port, then trigger a server start."""
         # Read Login Start (packet 0x00 in login state)
-        pkt_id, stream = await asyncio.wait_for(read_packet(reader), timeout=5)
+        async with asyncio.timeout(5):
+            pkt_id, payload = await read_packet_payload(reader)
         if pkt_id != 0x00:
             return
-        login = LoginStart.parse(stream)
+        login = LoginStart.from_payload(payload)
+        cfg = sm.cfg
 
         log.info(
-            f"Wake-up trigger from player '{login.player_name}' ({peer[0]}) on port {sm.cfg.listen_port} (server '{name}')",
+            f"Wake-up trigger from player '{login.player_name}' ({peer[0]}) on port {cfg.listen_port} (server '{name}')",
         )
 
-        # Send Disconnect (kick) message
-        writer.write(build_disconnect(sm.cfg.kick_message))
-        await writer.drain()
-
-        # Close this client connection immediately so the port isn't held.
+        # Send Disconnect (kick) message and close this client connection
+        # immediately so the port isn't held.  close() flushes the buffered
+        # kick before the FIN, so no separate drain is needed.
+        writer.write(build_disconnect(cfg.kick_message))
         try:
             writer.close()
             await writer.wait_closed()
         except Exception:
             pass
 
-        # Trigger server start if not already starting
-        if sm.state in (State.STOPPED, State.CRASHED):
-            # ── CRITICAL: release the port BEFORE asking Crafty to start ──
-            # Stop the proxy listener so the MC server can bind to the port.
-            await self._stop_listener(name)
-
-            # Lock out this server from ensure_listeners re-binding.
+        # Trigger server start if not already starting (or being started by
+        # another login that got in first).
+        if sm.state in INACTIVE_STATES and name not in self._start_lockout:
+            # Lock out this server from ensure_listeners re-binding — before
+            # the first await, so nothing can slip in between.
             self._start_lockout.add(name)
-
-            # Give the OS a moment to fully release the socket.
-            await asyncio.sleep(5)
-
+            self._pending_start.add(name)
+            self._last_desired.pop(name, None)
             try:
-                await self._api.start_server(sm.cfg.crafty_server_id)
-                sm.transition(State.STARTING)
-                log.info(
-                    f"Port {sm.cfg.listen_port} released and start_server sent for '{name}' (lockout active)",
-                )
-                if self._webhook:
-                    self._start_notify_task = asyncio.ensure_future(
-                        self._webhook.notify_started(name, player_name=login.player_name)
+                # ── CRITICAL: release the port BEFORE asking Crafty to start ──
+                # Stop the proxy listener so the MC server can bind to the
+                # port.  The listening socket is gone once this returns, and
+                # the JVM binds only seconds after Crafty launches it, so no
+                # settling delay is needed.
+                await self._stop_listener(name)
+
+                try:
+                    await self._api.start_server(cfg.crafty_server_id)
+                    sm.transition(State.STARTING)
+                    log.info(
+                        f"Port {cfg.listen_port} released and start_server sent for '{name}' (lockout active)",
                     )
-            except Exception:
-                log.exception(f"Failed to start server '{name}' via Crafty API")
-                # Clear lockout and re-bind the proxy so players can still see the MOTD.
-                self._start_lockout.discard(name)
-                await self._start_listener(name)
+                    if self._webhook:
+                        task = asyncio.create_task(
+                            self._webhook.notify_started(name, player_name=login.player_name)
+                        )
+                        self._webhook_tasks.add(task)
+                        task.add_done_callback(self._webhook_tasks.discard)
+                except Exception:
+                    log.exception(f"Failed to start server '{name}' via Crafty API")
+                    # Clear lockout and re-bind the proxy so players can still see the MOTD.
+                    self._start_lockout.discard(name)
+                    self._request_listener(name)
+            finally:
+                self._pending_start.discard(name)
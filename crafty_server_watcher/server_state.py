@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import enum
 import logging
 import time
 from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
 from .config import CooldownConfig, ServerConfig
@@ -25,15 +27,18 @@ class State(enum.Enum):
     CRASHED = "CRASHED"
 
 
-# Allowed transitions: from_state → {set of valid to_states}
-_VALID_TRANSITIONS: dict[State, set[State]] = {
-    State.UNKNOWN: {State.ONLINE, State.IDLE, State.STOPPED, State.CRASHED},
-    State.ONLINE: {State.IDLE, State.STOPPED, State.CRASHED},
-    State.IDLE: {State.ONLINE, State.STOPPING, State.STOPPED, State.CRASHED},
-    State.STOPPING: {State.STOPPED, State.CRASHED},
-    State.STOPPED: {State.STARTING, State.ONLINE},
-    State.STARTING: {State.ONLINE, State.STOPPED, State.CRASHED},
-    State.CRASHED: {State.STOPPED, State.ONLINE},
+# States in which the real server is down and the proxy owns the port.
+INACTIVE_STATES: frozenset[State] = frozenset({State.STOPPED, State.CRASHED})
+
+# Allowed transitions: from_state → {set of valid to_states}.  Every State is a key.
+_VALID_TRANSITIONS: dict[State, frozenset[State]] = {
+    State.UNKNOWN: frozenset({State.ONLINE, State.IDLE, State.STOPPED, State.CRASHED}),
+    State.ONLINE: frozenset({State.IDLE, State.STOPPED, State.CRASHED}),
+    State.IDLE: frozenset({State.ONLINE, State.STOPPING, State.STOPPED, State.CRASHED}),
+    State.STOPPING: frozenset({State.STOPPED, State.CRASHED}),
+    State.STOPPED: frozenset({State.STARTING, State.ONLINE}),
+    State.STARTING: frozenset({State.ONLINE, State.STOPPED, State.CRASHED}),
+    State.CRASHED: frozenset({State.STOPPED, State.ONLINE}),
 }
 
 
@@ -65,6 +70,15 @@ class ServerStateMachine:
         Last observed MC version string.
     last_known_icon:
         Last observed server icon (base64).
+    state_changed:
+        Optional event set on every successful transition, so listeners can
+        react to state changes instead of polling.
+    on_idle_timeout:
+        Optional callback scheduled to run once the server has been IDLE for
+        its full idle timeout (cancelled if it leaves IDLE first), so the
+        idle monitor can act at that moment instead of on its next poll.
+    idle_timer:
+        Handle of the pending *on_idle_timeout* call, if any.
     """
 
     cfg: ServerConfig
@@ -80,19 +94,22 @@ class ServerStateMachine:
     last_known_max: int = 20
     last_known_version: str = ""
     last_known_icon: str = ""
+    state_changed: asyncio.Event | None = field(default=None, repr=False)
+    on_idle_timeout: Callable[[], object] | None = field(default=None, repr=False)
+    idle_timer: asyncio.TimerHandle | None = field(default=None, repr=False)
 
     # -- Transitions ----------------------------------------------------------
 
-    def transition(self, new_state: State) -> None:
+    def transition(self, new_state: State, now: float | None = None) -> None:
         """Transition to *new_state*, enforcing the valid-transition graph.
 
-        Also updates bookkeeping timestamps where applicable.
+        Also updates bookkeeping timestamps where applicable, using *now*
+        (a ``time.monotonic()`` value) when the caller already has one.
         """
         if new_state == self.state:
             return  # no-op for self-transitions
 
-        valid = _VALID_TRANSITIONS.get(self.state, set())
-        if new_state not in valid:
+        if new_state not in _VALID_TRANSITIONS[self.state]:
             log.warning(
                 f"Server '{self.cfg.name}': invalid transition {self.state.value} → {new_state.value} (ignored)",
             )
@@ -100,10 +117,20 @@ class ServerStateMachine:
 
         old = self.state
         self.state = new_state
-        now = time.monotonic()
+        if now is None:
+            now = time.monotonic()
+
+        if self.idle_timer is not None:
+            # Leaving IDLE (the only state that arms it).
+            self.idle_timer.cancel()
+            self.idle_timer = None
 
         if new_state == State.IDLE:
             self.idle_since = now
+            if self.on_idle_timeout is not None:
+                self.idle_timer = asyncio.get_running_loop().call_later(
+                    self.cfg.idle_timeout_seconds, self.on_idle_timeout
+                )
         elif new_state == State.STOPPING:
             self.idle_since = None
         elif new_state == State.STOPPED:
@@ -121,37 +148,50 @@ class ServerStateMachine:
         log.info(
             f"Server '{self.cfg.name}' (port {self.cfg.listen_port}): {old.value} → {new_state.value}",
         )
+        if self.state_changed is not None:
+            self.state_changed.set()
 
     # -- Timing queries -------------------------------------------------------
+    # Each takes an optional *now* (a ``time.monotonic()`` value) so a caller
+    # checking several can sample the clock once.
 
-    def idle_elapsed(self) -> float:
+    def idle_elapsed(self, now: float | None = None) -> float:
         """Seconds since the server became idle, or 0 if not idle."""
         if self.idle_since is None:
             return 0.0
-        return time.monotonic() - self.idle_since
+        return (time.monotonic() if now is None else now) - self.idle_since
 
-    def idle_timeout_reached(self) -> bool:
+    def idle_timeout_reached(self, now: float | None = None) -> bool:
         """True if the server has been idle long enough to trigger a shutdown."""
-        return self.idle_elapsed() >= self.cfg.idle_timeout_minutes * 60
+        return self.idle_elapsed(now) >= self.cfg.idle_timeout_seconds
 
-    def in_start_grace(self) -> bool:
+    def in_start_grace(self, now: float | None = None) -> bool:
         """True if the start-grace period has not yet elapsed."""
         if self.last_start_time is None:
             return False
-        return (time.monotonic() - self.last_start_time) < self.cooldowns.start_grace_minutes * 60
+        if now is None:
+            now = time.monotonic()
+        return (now - self.last_start_time) < self.cooldowns.start_grace_seconds
 
-    def in_stop_cooldown(self) -> bool:
+    def in_stop_cooldown(self, now: float | None = None) -> bool:
         """True if the stop-cooldown period has not yet elapsed."""
         if self.last_stop_time is None:
             return False
-        return (time.monotonic() - self.last_stop_time) < self.cooldowns.stop_cooldown_minutes * 60
+        if now is None:
+            now = time.monotonic()
+        return (now - self.last_stop_time) < self.cooldowns.stop_cooldown_seconds
 
-    def is_flapping(self) -> bool:
+    def is_flapping(self, now: float | None = None) -> bool:
         """True if the server has cycled start/stop too many times recently."""
-        window = self.cooldowns.flap_window_minutes * 60
-        cutoff = time.monotonic() - window
-        recent = sum(1 for ts in self.start_stop_history if ts > cutoff)
-        return recent >= self.cooldowns.flap_max_cycles * 2  # each cycle = 1 start + 1 stop
+        if now is None:
+            now = time.monotonic()
+        cutoff = now - self.cooldowns.flap_window_seconds
+        # Timestamps are appended in order, so everything outside the window
+        # sits at the left end; drop it and what's left is the recent count.
+        history = self.start_stop_history
+        while history and history[0] <= cutoff:
+            history.popleft()
+        return len(history) >= self.cooldowns.flap_max_cycles * 2  # each cycle = 1 start + 1 stop
 
     # -- Convenience ----------------------------------------------------------
 
@@ -163,7 +203,7 @@ class ServerStateMachine:
         port during startup.  The proxy re-binds after the server stops
         or if the start times out.
         """
-        return self.state in (State.STOPPED, State.CRASHED)
+        return self.state in INACTIVE_STATES
 
     def update_from_stats(self, stats: dict) -> None:
         """Update cached fields from a Crafty stats API response.
@@ -6,7 +6,8 @@ generic webhook URL) when key server lifecycle events occur:
 - Server stopped (idle shutdown)
 - Server crashed
 
-Uses stdlib http.client + asyncio.to_thread() — no external dependencies.
+Uses stdlib http.client on a dedicated sender thread — no external
+dependencies.
 """
 
 from __future__ import annotations
@@ -17,6 +18,7 @@ import json
 import logging
 import ssl
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from urllib.parse import urlparse
 
@@ -28,6 +30,34 @@ _COLOR_YELLOW = 0xF1C40F  # stopping / idle
 _COLOR_RED = 0xE74C3C  # crashed / error
 _COLOR_BLUE = 0x3498DB  # info
 
+# Domains that serve Discord webhooks; subdomains (ptb., canary., ...) count too.
+_DISCORD_DOMAINS = ("discord.com", "discordapp.com")
+
+
+def _is_discord_host(host: str | None) -> bool:
+    """Whether *host* is a Discord domain or one of its subdomains."""
+    if not host:
+        return False
+    return any(host == d or host.endswith("." + d) for d in _DISCORD_DOMAINS)
+
+
+# Discord accepts at most this many embeds in one message.
+_MAX_EMBEDS = 10
+
+# How long a Discord notification waits for others to share its message.
+_BATCH_DELAY = 0.25
+
+# The keep-alive connection is only reused if it was last used this recently;
+# older ones are likely to have been closed by the server.
+_KEEPALIVE_IDLE = 15.0
+
+# Embed title -> event name used in generic JSON payloads.
+_EVENT_NAMES: dict[str, str] = {
+    "Server Starting": "server_starting",
+    "Server Stopped": "server_stopped",
+    "Server Crashed": "server_crashed",
+}
+
 
 class WebhookNotifier:
     """Async webhook notifier for server lifecycle events.
@@ -43,15 +73,34 @@ class WebhookNotifier:
     def __init__(self, webhook_url: str, server_name_label: str = ""):
         self._url = webhook_url
         self._label = server_name_label
-        self._is_discord = (
-            "discord.com/api/webhooks" in webhook_url
-            or "discordapp.com/api/webhooks" in webhook_url
+        # Shared by every embed; never mutated after construction.
+        self._footer: dict[str, str] | None = (
+            {"text": server_name_label} if server_name_label else None
         )
         parsed = urlparse(webhook_url)
+        self._is_discord = _is_discord_host(parsed.hostname) and parsed.path.startswith(
+            "/api/webhooks"
+        )
         self._host = parsed.hostname or ""
         self._port = parsed.port
         self._path = parsed.path + (f"?{parsed.query}" if parsed.query else "")
         self._scheme = parsed.scheme
+        # Created on first HTTPS send — loading the CA bundle is not free and
+        # many deployments never fire a notification.
+        self._ssl_ctx: ssl.SSLContext | None = None
+        # One keep-alive connection, reused across notifications so crash
+        # storms don't pay a TCP + TLS handshake per message.  It is owned by
+        # a single sender thread, which also serialises the posts without
+        # tying up the default executor that the Crafty API client uses.
+        self._conn: http.client.HTTPConnection | None = None
+        self._conn_used = 0.0  # time.monotonic() of the last response on it
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="webhook")
+        # Discord embeds waiting to be posted as (title, server name, embed),
+        # and the task that will post them.  Events that fire together (a
+        # crash storm, several servers idling out on one poll) go out as one
+        # message instead of one request each.
+        self._pending: list[tuple[str, str, dict[str, Any]]] = []
+        self._flush_task: asyncio.Task[None] | None = None
 
     async def notify_started(self, server_name: str, player_name: str = "") -> None:
         """Notify that a server was started (wake-up)."""
@@ -88,60 +137,132 @@ class WebhookNotifier:
         )
 
     async def _send(self, title: str, description: str, color: int, server_name: str) -> None:
-        """Send the notification (Discord embed or generic JSON POST)."""
+        """Send the notification (Discord embed or generic JSON POST).
+
+        Discord embeds are batched; this returns once the message carrying
+        this one has been posted (or has failed).
+        """
         if self._is_discord:
-            payload = self._build_discord_payload(title, description, color)
-        else:
-            payload = {
-                "event": title.lower().replace(" ", "_"),
-                "server": server_name,
-                "message": description,
-                "timestamp": int(time.time()),
-            }
+            self._pending.append((title, server_name, self._build_embed(title, description, color)))
+            if self._flush_task is None or self._flush_task.done():
+                # Safe to start eagerly: the embed is already queued and the
+                # flush's first step is the batching sleep.
+                self._flush_task = asyncio.create_task(self._flush_discord())
+            # Shielded: a cancelled caller must not cancel everyone's batch.
+            await asyncio.shield(self._flush_task)
+            return
 
+        # Generic receivers expect exactly one event object per request.
+        payload = {
+            "event": _EVENT_NAMES[title],
+            "server": server_name,
+            "message": description,
+            "timestamp": int(time.time()),
+        }
         try:
-            await asyncio.to_thread(self._post_json, payload)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, self._post_json, payload)
             log.info(f"Webhook sent: {title} for '{server_name}'")
         except Exception:
             log.exception(f"Failed to send webhook notification for '{server_name}'")
 
-    def _build_discord_payload(self, title: str, description: str, color: int) -> dict[str, Any]:
+    async def _flush_discord(self) -> None:
+        """Post pending Discord embeds, up to ``_MAX_EMBEDS`` per message."""
+        await asyncio.sleep(_BATCH_DELAY)
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            batch = self._pending[:_MAX_EMBEDS]
+            del self._pending[:_MAX_EMBEDS]
+            payload = {"embeds": [embed for _, _, embed in batch]}
+            try:
+                await loop.run_in_executor(self._executor, self._post_json, payload)
+            except Exception:
+                names = ", ".join(f"'{server_name}'" for _, server_name, _ in batch)
+                log.exception(f"Failed to send webhook notification for {names}")
+                continue
+            for title, server_name, _ in batch:
+                log.info(f"Webhook sent: {title} for '{server_name}'")
+
+    def _build_embed(self, title: str, description: str, color: int) -> dict[str, Any]:
         embed: dict[str, Any] = {
             "title": title,
             "description": description,
             "color": color,
             "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         }
-        if self._label:
-            embed["footer"] = {"text": self._label}
+        if self._footer is not None:
+            embed["footer"] = self._footer
+        return embed
 
-        return {
-            "embeds": [embed],
-        }
+    async def close(self) -> None:
+        """Close the keep-alive connection and stop the sender thread.
 
-    def _post_json(self, payload: dict) -> None:
-        """Synchronous HTTP POST (called via asyncio.to_thread)."""
-        body = json.dumps(payload).encode("utf-8")
+        Notifications already queued are still sent first.
+        """
+        if self._flush_task is not None:
+            await self._flush_task
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._drop_connection)
+        self._executor.shutdown(wait=False)
 
+    def _connection(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Return (connection, reused): the cached one, or a newly opened one."""
+        if self._conn is not None and time.monotonic() - self._conn_used > _KEEPALIVE_IDLE:
+            self._drop_connection()
+        if self._conn is not None:
+            return self._conn, True
         if self._scheme == "https":
-            ctx = ssl.create_default_context()
-            conn = http.client.HTTPSConnection(self._host, self._port, context=ctx, timeout=10)
+            if self._ssl_ctx is None:
+                self._ssl_ctx = ssl.create_default_context()
+            self._conn = http.client.HTTPSConnection(
+                self._host, self._port, context=self._ssl_ctx, timeout=10
+            )
         else:
-            conn = http.client.HTTPConnection(self._host, self._port, timeout=10)
+            self._conn = http.client.HTTPConnection(self._host, self._port, timeout=10)
+        return self._conn, False
 
-        try:
-            conn.request(
-                "POST",
-                self._path,
-                body=body,
-                headers={
-                    "Content-Type": "application/json",
-                    "Content-Length": str(len(body)),
-                },
-            )
-            resp = conn.getresponse()
-            if resp.status >= 400:
-                resp_body = resp.read().decode("utf-8", errors="replace")[:200]
-                log.warning(f"Webhook returned {resp.status}: {resp_body}")
-        finally:
-            conn.close()
+    def _drop_connection(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _post_json(self, payload: dict) -> None:
+        """Synchronous HTTP POST (runs on the sender thread)."""
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        headers = {
+            "Content-Type": "application/json",
+            "Content-Length": str(len(body)),
+        }
+
+        # A reused keep-alive socket may have been closed by the server.  If
+        # that shows while sending, the request never went out, so retry once
+        # on a fresh connection.  Once it has been sent it may already have
+        # been delivered: never resend then, or the message shows up twice.
+        while True:
+            conn, reused = self._connection()
+            try:
+                conn.request("POST", self._path, body=body, headers=headers)
+            except (http.client.BadStatusLine, ConnectionError):
+                self._drop_connection()
+                if reused:
+                    continue
+                raise
+            except Exception:
+                self._drop_connection()
+                raise
+            try:
+                resp = conn.getresponse()
+                # Drain the body so the connection can be reused.
+                resp_body = resp.read()
+            except Exception:
+                self._drop_connection()
+                raise
+            if resp.will_close:
+                self._drop_connection()
+            else:
+                self._conn_used = time.monotonic()
+            break
+
+        if resp.status >= 400:
+            text = resp_body.decode("utf-8", errors="replace")[:200]
+            log.warning(f"Webhook returned {resp.status}: {text}")